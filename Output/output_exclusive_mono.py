@@ -18,7 +18,7 @@ from Source.exclusive_mono import ExclusiveMonolithicEnforcer
 
 # Build Exclusive Monolithic Enforcer (n-ary, automatic)
 mods = get_all_exclusive_modified()
-A_and = product(*mods, "Exclusive_Mono")
+A_and = product(*mods, "Exclusive_Mono", lazy=True)
 enforcer = ExclusiveMonolithicEnforcer(A_and)
 
 print("\n=== Exclusive Monolithic Enforcer ===")
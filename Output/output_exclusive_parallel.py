@@ -9,7 +9,7 @@ import os
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(PROJECT_ROOT)
 
-from Source.exclusive_parallel_1_opt import ExclusiveParallelEnforcer
+from Source.exclusive_parallel_opt import ExclusiveParallelEnforcer
 from helper.exclusive_modified_automata import get_all_exclusive_modified
 
 
@@ -35,7 +35,7 @@ while True:
         print("Invalid event!")
         continue
 
-    out, debug = enf.step(a)
+    out, debug = enf.step_debug(a)
 
     for info in debug:
         print(
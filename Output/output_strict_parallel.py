@@ -38,6 +38,6 @@ while True:
     released = enforcer.step(a)
 
     print("Released output :", released)
-    print("Current states  :", enforcer.q)
+    print("Current states  :", enforcer.states())
     print("Global output   :", enforcer.output)
     print("-" * 50)
@@ -0,0 +1,20 @@
+"""
+Benchmark package for the enforcers in Source/.
+
+    python -m Performance.bench --sizes 1000,10000 --props 2,4,8 --out results
+
+writes results.json and results.csv with one record per
+enforcer x property count x input size; --latency adds per-event latency
+histograms in results_latency.json / .csv and --memory the tracemalloc
+footprint in results_memory.json / .csv. --workload picks the trace
+generator (uniform, markov, bursty, replay, adversarial); --family random
+benchmarks a seeded random family whose size and shape are set by the
+--random-* options.
+"""
+
+from Performance.bench.harness import bench_case, run_grid, trace, traces, write_csv, write_json
+from Performance.bench.latency import LogHistogram, latency_case, run_latency_grid
+from Performance.bench.memory import memory_case, run_memory_grid
+from Performance.bench.registry import ENFORCERS, FAMILIES, MAX_PRODUCT_STATES, register_random_family
+from Performance.bench.stats import median_ci, percentile, summarize
+from Performance.bench.workloads import WORKLOADS, Adversary, sampler
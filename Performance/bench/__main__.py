@@ -0,0 +1,102 @@
+"""
+Command line entry point: python -m Performance.bench --help
+"""
+
+import argparse
+
+from Performance.bench.harness import run_grid, write_csv, write_json
+from Performance.bench.latency import run_latency_grid
+from Performance.bench.memory import run_memory_grid
+from Performance.bench.registry import ENFORCERS, FAMILIES, register_random_family
+from Performance.bench.workloads import WORKLOADS
+
+
+def _ints(s):
+    return [int(x) for x in s.split(",") if x]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Performance.bench",
+                                     description="Enforcer timing benchmark")
+    parser.add_argument("--enforcers", default=",".join(ENFORCERS),
+                        help="comma-separated subset of: " + ", ".join(ENFORCERS))
+    parser.add_argument("--sizes", type=_ints, default=[100, 1000, 10000],
+                        help="comma-separated input sizes")
+    parser.add_argument("--props", type=_ints, default=None,
+                        help="comma-separated property counts (default: all)")
+    parser.add_argument("--family", choices=sorted(FAMILIES), default="prop")
+    random = parser.add_argument_group("random family (--family random)")
+    random.add_argument("--random-props", type=int, default=60)
+    random.add_argument("--random-states", type=int, default=120)
+    random.add_argument("--random-symbols", type=int, default=8,
+                        help="events (exclusive properties add their own "
+                             "deciding events on top)")
+    random.add_argument("--random-accepting", type=float, default=0.3,
+                        help="fraction of accepting states")
+    random.add_argument("--random-trap", type=int, choices=(0, 1), default=1,
+                        help="add an absorbing trap state (1) or not (0)")
+    random.add_argument("--random-deciding", type=int, default=1,
+                        help="deciding events per exclusive property")
+    random.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument("--workload", choices=WORKLOADS, default="uniform")
+    parser.add_argument("--replay",
+                        help="file of whitespace-separated recorded events "
+                             "(implies --workload replay)")
+    parser.add_argument("--reps", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", action="store_true",
+                        help="also record per-event latency histograms")
+    parser.add_argument("--latency-reps", type=int, default=5)
+    parser.add_argument("--memory", action="store_true",
+                        help="also record memory footprint with tracemalloc")
+    parser.add_argument("--memory-reps", type=int, default=3)
+    parser.add_argument("--out", default="bench_results",
+                        help="output path prefix for .json and .csv")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = args.enforcers.split(",")
+
+    if args.family == "random":
+        register_random_family("random", args.random_props, args.random_states,
+                               args.random_symbols, args.random_accepting,
+                               bool(args.random_trap), args.random_deciding,
+                               args.random_seed)
+
+    recorded = None
+    if args.replay:
+        with open(args.replay) as f:
+            recorded = f.read().split()
+        args.workload = "replay"
+    workload = dict(workload=args.workload, recorded=recorded)
+
+    records = run_grid(names, args.sizes, args.props, args.reps, args.warmup,
+                       args.seed, args.family, **workload)
+    write_json(records, args.out + ".json")
+    write_csv(records, args.out + ".csv")
+    print(f"\nSaved {args.out}.json and {args.out}.csv")
+
+    if args.latency:
+        print("\n----- per-event latency -----")
+        records = run_latency_grid(names, args.sizes, args.props,
+                                   args.latency_reps, 1, args.seed,
+                                   args.family, **workload)
+        write_json(records, args.out + "_latency.json")
+        write_csv(records, args.out + "_latency.csv")
+        print(f"\nSaved {args.out}_latency.json and {args.out}_latency.csv")
+
+    if args.memory:
+        print("\n----- memory -----")
+        records = run_memory_grid(names, args.sizes, args.props,
+                                  args.memory_reps, args.seed, args.family,
+                                  **workload)
+        write_json(records, args.out + "_memory.json")
+        write_csv(records, args.out + "_memory.csv")
+        print(f"\nSaved {args.out}_memory.json and {args.out}_memory.csv")
+
+
+if __name__ == "__main__":
+    main()
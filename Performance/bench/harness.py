@@ -0,0 +1,160 @@
+"""
+harness.py
+
+Timing harness. One case is (enforcer, property count, input size):
+
+  - setup:  building the enforcer from freshly loaded DFAs (products,
+            minimisation, compilation), timed once per repetition
+  - run:    feed_many() over a seeded trace on a reset enforcer, timed
+            per repetition after the warmup runs
+
+Traces come from a seeded workload (workloads.py) and depend only on
+(workload, seed, input size, repetition) and, for adversarial traces, the
+DFA set, so every enforcer over the same alphabet sees the same inputs.
+All times are perf_counter_ns with the garbage collector paused.
+"""
+
+import csv
+import gc
+import json
+import time
+
+import numpy as np
+
+from Performance.bench import registry, workloads
+from Performance.bench.stats import summarize
+
+
+def to_symbols(symbols, codes):
+    return np.asarray(symbols, dtype=object)[codes].tolist()
+
+
+def trace(symbols, n, seed, rep):
+    """
+    Uniform seeded trace of n events over symbols, as a list of symbols.
+    """
+    return to_symbols(symbols, workloads.uniform(len(symbols), n,
+                                                 workloads.rng_for(seed, n, rep)))
+
+
+def traces(name, family, k, seed, workload="uniform", recorded=None):
+    """
+    draw(n, rep) -> list of symbols for enforcer name over its first k
+    properties, from the named workload.
+    """
+    dfas = registry.load_dfas(name, family, k)
+    symbols = registry.alphabet(dfas)
+    sample = workloads.sampler(workload, dfas, registry.accept(name), seed,
+                               recorded, registry.buffers_past_trap(name),
+                               registry.MAX_PRODUCT_STATES)
+    return lambda n, rep: to_symbols(symbols, sample(n, rep))
+
+
+def _timed(fn, *args):
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter_ns()
+        result = fn(*args)
+        return time.perf_counter_ns() - t0, result
+    finally:
+        gc.enable()
+
+
+def bench_case(name, k, n, reps=20, warmup=3, seed=0, family="prop",
+               workload="uniform", recorded=None):
+    """
+    Benchmark one case; returns a flat record with setup and run
+    statistics in nanoseconds.
+    """
+    setup_ns, run_ns = [], []
+    enf = None
+
+    for _ in range(reps):
+        dfas = registry.load_dfas(name, family, k)
+        t, enf = _timed(registry.build, name, dfas)
+        setup_ns.append(t)
+
+    draw = traces(name, family, k, seed, workload, recorded)
+
+    for w in range(warmup):
+        enf.reset()
+        enf.feed_many(draw(n, reps + w))
+
+    for rep in range(reps):
+        word = draw(n, rep)
+        enf.reset()
+        t, _ = _timed(enf.feed_many, word)
+        run_ns.append(t)
+
+    record = {
+        "enforcer": name,
+        "family": family,
+        "properties": len(dfas),
+        "input_size": n,
+        "workload": workload,
+        "reps": reps,
+        "warmup": warmup,
+        "seed": seed,
+    }
+    for label, xs in (("setup", setup_ns), ("run", run_ns)):
+        for stat, value in summarize(xs).items():
+            if stat != "n":
+                record[f"{label}_{stat}_ns"] = value
+    record["ns_per_event"] = record["run_median_ns"] / n if n else 0.0
+    return record
+
+
+def describe(r):
+    return (f"median {r['run_median_ns'] / 1e6:.3f} ms "
+            f"[{r['run_ci_low_ns'] / 1e6:.3f}, {r['run_ci_high_ns'] / 1e6:.3f}] "
+            f"p95 {r['run_p95_ns'] / 1e6:.3f} ms | "
+            f"setup {r['setup_median_ns'] / 1e6:.3f} ms")
+
+
+def run_grid(names, sizes, props=None, reps=20, warmup=3, seed=0,
+             family="prop", log=print, case=bench_case, describe=describe,
+             workload="uniform", recorded=None):
+    """
+    case(name, k, n, reps, warmup, seed, family, workload, recorded) for
+    every case of names x props x sizes. props=None uses all properties of each
+    enforcer's family; counts beyond a family are skipped. A product that
+    runs out of memory is recorded with status "memory_error".
+    """
+    records = []
+    for name in names:
+        ks = props or [registry.max_properties(name, family)]
+        for k in ks:
+            if k > registry.max_properties(name, family):
+                continue
+            for n in sizes:
+                try:
+                    r = case(name, k, n, reps, warmup, seed, family,
+                             workload, recorded)
+                    r["status"] = "ok"
+                    log(f"{name} | {k} properties | {n} events | {describe(r)}")
+                except MemoryError:
+                    r = {"enforcer": name, "family": family, "properties": k,
+                         "input_size": n, "workload": workload,
+                         "status": "memory_error"}
+                    log(f"{name} | {k} properties | MEMORY ERROR (state explosion)")
+                records.append(r)
+    return records
+
+
+def write_json(records, path):
+    with open(path, "w") as f:
+        json.dump(records, f, indent=2)
+
+
+def write_csv(records, path):
+    # Scalar fields only; nested data such as histograms stays in the JSON
+    fields = []
+    for r in records:
+        for key, value in r.items():
+            if key not in fields and not isinstance(value, (list, dict)):
+                fields.append(key)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
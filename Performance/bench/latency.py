@@ -0,0 +1,194 @@
+"""
+latency.py
+
+Per-event latency. Each feed(a) is timed with perf_counter_ns and the
+samples go into a log-bucketed histogram: values below 16 ns are exact,
+above that every power of two is split into 8 buckets, so any quantile is
+within 12.5% of the true value whatever the range. The fixed cost of the
+timer pair is measured once and subtracted.
+"""
+
+import gc
+import time
+from array import array
+from functools import partial
+
+import numpy as np
+
+from Performance.bench import registry
+from Performance.bench.harness import run_grid, traces
+
+SUB_BITS = 3
+SUB = 1 << SUB_BITS
+EXACT = SUB << 1    # values below this have their own bucket
+
+
+class LogHistogram:
+
+    def __init__(self):
+        self.counts = []
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket(x):
+        if x < EXACT:
+            return x
+        shift = x.bit_length() - 1 - SUB_BITS
+        return (shift + 1) * SUB + ((x >> shift) & (SUB - 1))
+
+    @staticmethod
+    def bounds(i):
+        # Smallest and largest value falling in bucket i
+        if i < EXACT:
+            return i, i
+        shift = i // SUB - 1
+        low = (SUB + i % SUB) << shift
+        return low, low + (1 << shift) - 1
+
+    def _grow(self, n):
+        if n > len(self.counts):
+            self.counts.extend([0] * (n - len(self.counts)))
+
+    def add(self, x):
+        i = self.bucket(x)
+        self._grow(i + 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += x
+        self.max = max(self.max, x)
+
+    def add_many(self, xs):
+        """
+        Add an array of non-negative integer samples in one pass.
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        if not len(xs):
+            return
+        _, e = np.frexp(xs.astype(np.float64))      # bit_length for x >= 1
+        shift = np.maximum(e.astype(np.int64) - 1 - SUB_BITS, 0)
+        idx = np.where(
+            xs < EXACT, xs, (shift + 1) * SUB + ((xs >> shift) & (SUB - 1))
+        )
+        binned = np.bincount(idx)
+        self._grow(len(binned))
+        for i in np.flatnonzero(binned).tolist():
+            self.counts[i] += int(binned[i])
+        self.count += len(xs)
+        self.total += int(xs.sum())
+        self.max = max(self.max, int(xs.max()))
+
+    def quantile(self, q):
+        """
+        Upper bound of the bucket holding the q-quantile (0..1), capped
+        at the largest sample.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(np.ceil(q * self.count)))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(self.bounds(i)[1], self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "events": self.count,
+            "mean_ns": self.total / self.count if self.count else 0.0,
+            "p50_ns": self.quantile(0.50),
+            "p90_ns": self.quantile(0.90),
+            "p99_ns": self.quantile(0.99),
+            "p999_ns": self.quantile(0.999),
+            "max_ns": self.max,
+        }
+
+    def buckets(self):
+        # [(low, high, count), ...] for the non-empty buckets
+        return [
+            (*self.bounds(i), c) for i, c in enumerate(self.counts) if c
+        ]
+
+
+def timer_overhead(samples=10000):
+    # Median cost of an empty perf_counter_ns pair
+    pc = time.perf_counter_ns
+    xs = []
+    for _ in range(samples):
+        t0 = pc()
+        xs.append(pc() - t0)
+    return int(np.median(xs))
+
+
+def record_latencies(enf, word, overhead=0):
+    """
+    Feed word to enf one event at a time and return the per-event times
+    (ns, timer overhead removed) as an int64 array.
+    """
+    feed = enf.feed
+    pc = time.perf_counter_ns
+    samples = array("q", bytes(8 * len(word)))
+    gc.disable()
+    try:
+        for j, a in enumerate(word):
+            t0 = pc()
+            feed(a)
+            samples[j] = pc() - t0
+    finally:
+        gc.enable()
+    return np.maximum(np.frombuffer(samples, dtype=np.int64) - overhead, 0)
+
+
+def latency_case(name, k, n, reps=5, warmup=1, seed=0, family="prop",
+                 workload="uniform", recorded=None, overhead=None):
+    """
+    Per-event latency histogram of one case over reps seeded traces.
+    """
+    if overhead is None:
+        overhead = timer_overhead()
+
+    dfas = registry.load_dfas(name, family, k)
+    enf = registry.build(name, dfas)
+    draw = traces(name, family, k, seed, workload, recorded)
+
+    for w in range(warmup):
+        enf.reset()
+        record_latencies(enf, draw(n, reps + w), overhead)
+
+    hist = LogHistogram()
+    for rep in range(reps):
+        enf.reset()
+        hist.add_many(record_latencies(enf, draw(n, rep), overhead))
+
+    record = {
+        "enforcer": name,
+        "family": family,
+        "properties": len(dfas),
+        "input_size": n,
+        "workload": workload,
+        "reps": reps,
+        "seed": seed,
+        "timer_overhead_ns": overhead,
+    }
+    record.update(hist.summary())
+    record["histogram"] = hist.buckets()
+    return record
+
+
+def describe(r):
+    return (f"p50 {r['p50_ns']} ns p90 {r['p90_ns']} ns "
+            f"p99 {r['p99_ns']} ns max {r['max_ns']} ns")
+
+
+def run_latency_grid(names, sizes, props=None, reps=5, warmup=1, seed=0,
+                     family="prop", log=print, workload="uniform",
+                     recorded=None):
+    """
+    latency_case for every case of names x props x sizes.
+    """
+    case = partial(latency_case, overhead=timer_overhead())
+    return run_grid(names, sizes, props, reps, warmup, seed, family, log,
+                    case=case, describe=describe, workload=workload,
+                    recorded=recorded)
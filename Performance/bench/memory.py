@@ -0,0 +1,172 @@
+"""
+memory.py
+
+Memory footprint per case, measured with tracemalloc:
+
+  - setup_peak_bytes:   peak allocation while building the enforcer
+  - table_*:            states, transition entries and bytes of the
+                        compiled automata the enforcer runs on (the
+                        product for monolithic enforcers)
+  - run_peak_bytes:     peak allocation above the built enforcer while
+                        feed_many() runs over the trace
+  - retained_bytes:     allocation still held after the run (buffers and
+                        the global output)
+  - peak_sigma_c/_s:    longest σc / σs of any component during the run
+  - peak_buffered:      most events physically held in buffers at once
+  - output_len:         length of the retained global output; None for
+                        enforcers that keep none (Exclusive_Parallel
+                        only returns its releases)
+
+Each figure is the maximum over the repetitions.
+"""
+
+import gc
+import tracemalloc
+
+from Performance.bench import registry
+from Performance.bench.harness import run_grid, traces
+
+
+def automata(enf):
+    # Compiled DFAs an enforcer steps through
+    if hasattr(enf, "dfa"):
+        return [enf.dfa]
+    if hasattr(enf, "dfas"):
+        return list(enf.dfas)
+    return list(enf.enforcers)
+
+
+def table_size(enf):
+    dfas = automata(enf)
+    return {
+        "automata": len(dfas),
+        "table_states": sum(len(dfa.states) for dfa in dfas),
+        "table_entries": sum(len(dfa.table) for dfa in dfas),
+        "table_bytes": sum(len(dfa.table) * dfa.table.itemsize
+                           + len(dfa.accepting) for dfa in dfas),
+    }
+
+
+def buffer_lengths(enf):
+    """
+    (longest σc, longest σs, events physically buffered) right now.
+    """
+    if hasattr(enf, "log"):
+        # Exclusive parallel: one shared log, σc_i starts at offset[i]
+        n = len(enf.log)
+        offsets = enf.offset.values()
+        sigma_c = n - min(offsets) if offsets else 0
+        sigma_s = max(enf.offset.get(i, n) for i in range(enf.n))
+        return sigma_c, sigma_s, n
+    if hasattr(enf, "pending"):
+        # Least-effort parallel: one shared pending log
+        return len(enf.pending), 0, len(enf.pending)
+    if not hasattr(enf, "sigma_c"):
+        return 0, 0, 0
+
+    sigma_c = enf.sigma_c
+    if isinstance(sigma_c, dict):
+        # Strict serial: one σc per stage
+        buffers = list(sigma_c.values())
+    elif hasattr(enf, "sigma_s"):
+        # One σc and σs per component
+        buffers = sigma_c
+    else:
+        # Monolithic: a single σc
+        return len(sigma_c), 0, len(sigma_c)
+
+    lengths = [len(b) for b in buffers]
+    sigma_s = [len(b) for b in getattr(enf, "sigma_s", [])]
+    return (max(lengths, default=0), max(sigma_s, default=0),
+            sum(lengths) + sum(sigma_s))
+
+
+def _traced(fn, *args):
+    # (result, peak bytes above the starting point, bytes still held)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak - base, current - base
+
+
+def memory_case(name, k, n, reps=3, warmup=0, seed=0, family="prop",
+                workload="uniform", recorded=None):
+    """
+    Memory figures of one case; warmup is accepted for run_grid and unused.
+    """
+    dfas = registry.load_dfas(name, family, k)
+    enf, setup_peak, _ = _traced(registry.build, name, dfas)
+    draw = traces(name, family, k, seed, workload, recorded)
+
+    record = {
+        "enforcer": name,
+        "family": family,
+        "properties": len(dfas),
+        "input_size": n,
+        "workload": workload,
+        "reps": reps,
+        "seed": seed,
+        "setup_peak_bytes": setup_peak,
+    }
+    record.update(table_size(enf))
+
+    run_peak = retained = 0
+    peak_c = peak_s = peak_held = 0
+    output_len = 0 if hasattr(enf, "output") else None
+
+    for rep in range(reps):
+        word = draw(n, rep)
+
+        enf.reset()
+        _, peak, held = _traced(enf.feed_many, word)
+        run_peak = max(run_peak, peak)
+        retained = max(retained, held)
+        if output_len is not None:
+            output_len = max(output_len, len(enf.output))
+
+        # Second, untraced pass for the buffer lengths after every event
+        enf.reset()
+        feed = enf.feed
+        for a in word:
+            feed(a)
+            c, s, h = buffer_lengths(enf)
+            if c > peak_c:
+                peak_c = c
+            if s > peak_s:
+                peak_s = s
+            if h > peak_held:
+                peak_held = h
+
+    record.update({
+        "run_peak_bytes": run_peak,
+        "retained_bytes": retained,
+        "peak_sigma_c": peak_c,
+        "peak_sigma_s": peak_s,
+        "peak_buffered": peak_held,
+        "output_len": output_len,
+    })
+    return record
+
+
+def describe(r):
+    return (f"setup peak {r['setup_peak_bytes'] / 1024:.1f} KiB | "
+            f"table {r['table_states']} states {r['table_bytes'] / 1024:.1f} KiB | "
+            f"run peak {r['run_peak_bytes'] / 1024:.1f} KiB | "
+            f"peak σc {r['peak_sigma_c']} σs {r['peak_sigma_s']} | "
+            f"output {'n/a' if r['output_len'] is None else r['output_len']}")
+
+
+def run_memory_grid(names, sizes, props=None, reps=3, seed=0, family="prop",
+                    log=print, workload="uniform", recorded=None):
+    """
+    memory_case for every case of names x props x sizes.
+    """
+    return run_grid(names, sizes, props, reps, 0, seed, family, log,
+                    case=memory_case, describe=describe, workload=workload,
+                    recorded=recorded)
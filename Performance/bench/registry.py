@@ -0,0 +1,152 @@
+"""
+registry.py
+
+The seven enforcers under benchmark and the property families they can be
+built over. A family maps each DFA kind to a loader returning fresh DFAs,
+so every build starts from uncompiled, unshared automata. Random families
+(register_random_family) scale past the hand-written ones.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import helper.dfa_definitions as default_definitions
+import Performance_prop.dfa_definitions_prop as prop_definitions
+from helper.exclusive_modified_automata import get_all_exclusive_modified
+from helper.product import product
+from helper.random_dfa import random_exclusive_family, random_property_family
+
+from Source.least_effort_mono import LeastEffortMonolithicEnforcer
+from Source.least_effort_parallel import LeastEffortParallelEnforcer
+from Source.strict_mono import StrictMonolithicEnforcer
+from Source.strict_serial import StrictSerialEnforcer
+from Source.strict_parallel import StrictParallelEnforcer
+from Source.exclusive_mono import ExclusiveMonolithicEnforcer
+from Source.exclusive_parallel_opt import ExclusiveParallelEnforcer
+
+
+def _definitions_family(module):
+    return {
+        "strict_mono": module.get_all_Strict_mono_dfas,
+        "strict_serial": module.get_all_Strict_serial_dfas,
+        "strict_parallel": module.get_all_Strict_parallel_dfas,
+        "LE_mono": module.get_all_LE_mono_dfas,
+        "LE_parallel": module.get_all_LE_parallel_dfas,
+        "exclusive": get_all_exclusive_modified,
+    }
+
+
+FAMILIES = {
+    "default": _definitions_family(default_definitions),
+    "prop": _definitions_family(prop_definitions),
+}
+
+
+def register_random_family(name="random", n_props=60, n_states=120,
+                           n_symbols=8, accepting=0.3, trap=True,
+                           deciding_size=1, seed=0):
+    """
+    Add a seeded random family (see helper.random_dfa) to FAMILIES. The
+    strict and least-effort kinds share one set of n_props properties
+    over n_symbols events. The exclusive kind gets its own properties
+    with pairwise disjoint deciding sets of deciding_size events, over
+    those deciding events plus n_symbols events that decide nothing.
+    Nothing is generated until a kind is first loaded.
+    """
+    @lru_cache(maxsize=None)
+    def properties():
+        return random_property_family(n_props, n_states, n_symbols,
+                                      accepting, trap, seed=seed)
+
+    @lru_cache(maxsize=None)
+    def exclusive():
+        return random_exclusive_family(n_props, n_states,
+                                       n_props * deciding_size + n_symbols,
+                                       deciding_size, accepting=accepting,
+                                       trap=trap, seed=seed)
+
+    def load():
+        return properties()()
+
+    FAMILIES[name] = {
+        "strict_mono": load,
+        "strict_serial": load,
+        "strict_parallel": load,
+        "LE_mono": load,
+        "LE_parallel": load,
+        "exclusive": lambda: get_all_exclusive_modified(exclusive()()),
+    }
+    return FAMILIES[name]
+
+
+register_random_family()
+
+
+# Product states a monolithic enforcer may materialise before its case is
+# recorded as a memory error
+MAX_PRODUCT_STATES = 200_000
+
+
+def _exclusive_mono(dfas):
+    return ExclusiveMonolithicEnforcer(
+        product(*dfas, "Exclusive_Mono", lazy=True, max_states=MAX_PRODUCT_STATES)
+    )
+
+
+# name -> (DFA kind, build(dfas))
+ENFORCERS = {
+    "Strict_Monolithic": ("strict_mono",
+                          lambda dfas: StrictMonolithicEnforcer(
+                              dfas, max_states=MAX_PRODUCT_STATES)),
+    "Strict_Serial": ("strict_serial", StrictSerialEnforcer),
+    "Strict_Parallel": ("strict_parallel", StrictParallelEnforcer),
+    "LE_Monolithic": ("LE_mono",
+                      lambda dfas: LeastEffortMonolithicEnforcer(
+                          "LE", *dfas, max_states=MAX_PRODUCT_STATES)),
+    "LE_Parallel": ("LE_parallel", LeastEffortParallelEnforcer),
+    "Exclusive_Monolithic": ("exclusive", _exclusive_mono),
+    "Exclusive_Parallel": ("exclusive", ExclusiveParallelEnforcer),
+}
+
+
+def load_dfas(name, family="prop", k=None):
+    """
+    Fresh DFAs for enforcer name: the first k of its kind in family
+    (all of them if k is None).
+    """
+    kind, _ = ENFORCERS[name]
+    dfas = FAMILIES[family][kind]()
+    if k is not None:
+        if k > len(dfas):
+            raise ValueError(f"{name}: family '{family}' has only {len(dfas)} properties")
+        dfas = dfas[:k]
+    return dfas
+
+
+def build(name, dfas):
+    _, make = ENFORCERS[name]
+    return make(dfas)
+
+
+def accept(name):
+    # Acceptance of the enforcer's combined property: any for least effort
+    return "or" if ENFORCERS[name][0].startswith("LE") else "and"
+
+
+def buffers_past_trap(name):
+    # Strict enforcers drop (or reject) once acceptance is unreachable;
+    # the others keep buffering
+    return not name.startswith("Strict")
+
+
+def alphabet(dfas):
+    # Symbol order shared by all traces over this alphabet
+    return sorted(dfas[0].S)
+
+
+def max_properties(name, family="prop"):
+    kind, _ = ENFORCERS[name]
+    return len(FAMILIES[family][kind]())
@@ -0,0 +1,66 @@
+"""
+stats.py
+
+Summary statistics for repeated timings. The median's confidence interval
+is distribution-free (binomial order statistics), so it holds for the
+skewed, outlier-prone distributions timings usually have.
+"""
+
+import math
+
+
+def percentile(xs, p):
+    """
+    p-th percentile (0..100) of xs, linear interpolation between ranks.
+    """
+    xs = sorted(xs)
+    if not xs:
+        raise ValueError("percentile of empty data")
+    pos = (len(xs) - 1) * p / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+
+
+def median_ci(xs, confidence=0.95):
+    """
+    Confidence interval for the median: the order statistics x_(j), x_(n-j+1)
+    with the largest j such that P(Binomial(n, 1/2) < j) <= (1 - confidence)/2.
+    With too few samples for that, (min, max).
+    """
+    xs = sorted(xs)
+    n = len(xs)
+    alpha = (1 - confidence) / 2
+
+    j, tail = 0, 0.0
+    while j < n // 2:
+        tail_next = tail + math.comb(n, j) / 2 ** n
+        if tail_next > alpha:
+            break
+        tail = tail_next
+        j += 1
+
+    if j == 0:
+        return xs[0], xs[-1]
+    return xs[j - 1], xs[n - j]
+
+
+def summarize(xs, confidence=0.95):
+    """
+    {n, min, median, mean, stdev, p95, ci_low, ci_high, max} of xs.
+    """
+    n = len(xs)
+    mean = sum(xs) / n
+    stdev = math.sqrt(sum((x - mean) ** 2 for x in xs) / (n - 1)) if n > 1 else 0.0
+    ci_low, ci_high = median_ci(xs, confidence)
+    return {
+        "n": n,
+        "min": min(xs),
+        "median": percentile(xs, 50),
+        "mean": mean,
+        "stdev": stdev,
+        "p95": percentile(xs, 95),
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "max": max(xs),
+    }
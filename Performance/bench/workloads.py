@@ -0,0 +1,283 @@
+"""
+workloads.py
+
+Seeded trace generators. Every generator returns an int64 NumPy array of
+symbol codes, indices into the sorted alphabet (registry.alphabet).
+
+  - uniform:      i.i.d. uniform symbols
+  - markov:       a Markov chain over symbols with a given transition matrix
+  - bursty:       geometric-length bursts, each drawn from one of several
+                  symbol distributions
+  - replay:       i.i.d. or first-order Markov resampling of a recorded trace
+  - adversarial:  a walk over the product of a DFA set that stays in
+                  non-accepting, still-live states for as long as possible,
+                  so the enforcers buffer as much as they can
+
+sampler() ties a workload to a DFA set and a seed for the harness.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+from helper.product import product_and, product_or
+
+
+def rng_for(seed, n, rep):
+    # One independent stream per (seed, input size, repetition)
+    return np.random.default_rng([seed, n, rep])
+
+
+def uniform(m, n, rng):
+    return rng.integers(0, m, size=n)
+
+
+def random_markov(m, rng, stay=0.5):
+    """
+    Row-stochastic m x m matrix with probability about `stay` of repeating
+    the last symbol and random weights elsewhere.
+    """
+    P = rng.random((m, m))
+    np.fill_diagonal(P, 0.0)
+    P *= (1 - stay) / P.sum(axis=1, keepdims=True)
+    P += np.eye(m) * stay
+    return P
+
+
+def markov(P, n, rng, start=None):
+    """
+    n symbols of the chain with transition matrix P (rows sum to 1);
+    start is the first symbol (drawn uniformly if None).
+    """
+    P = np.asarray(P, dtype=np.float64)
+    m = len(P)
+    cum = np.cumsum(P, axis=1)
+    cum /= cum[:, -1:]
+    cum = cum.tolist()
+
+    out = np.empty(n, dtype=np.int64)
+    if not n:
+        return out
+    s = int(rng.integers(m)) if start is None else start
+    out[0] = s
+    last = m - 1
+    for t, u in enumerate(rng.random(n - 1).tolist(), 1):
+        s = min(bisect_right(cum[s], u), last)
+        out[t] = s
+    return out
+
+
+def bursty(distributions, n, rng, mean_burst=32, weights=None):
+    """
+    Bursts of geometric length (mean mean_burst); each burst picks one of
+    the symbol distributions (by weights) and draws i.i.d. from it.
+    """
+    D = np.asarray(distributions, dtype=np.float64)
+    D /= D.sum(axis=1, keepdims=True)
+    k, m = D.shape
+
+    lengths = []
+    total = 0
+    while total < n:
+        more = rng.geometric(1 / mean_burst, size=max(16, 2 * (n - total) // mean_burst))
+        lengths.append(more)
+        total += int(more.sum())
+    lengths = np.concatenate(lengths)
+    components = rng.choice(k, size=len(lengths), p=weights)
+    which = np.repeat(components, lengths)[:n]
+
+    out = np.empty(n, dtype=np.int64)
+    for c in range(k):
+        sel = np.flatnonzero(which == c)
+        out[sel] = rng.choice(m, size=len(sel), p=D[c])
+    return out
+
+
+def burst_distributions(m, focus=0.9):
+    # One distribution per symbol, putting `focus` of the mass on it
+    D = np.full((m, m), (1 - focus) / max(m - 1, 1))
+    np.fill_diagonal(D, focus if m > 1 else 1.0)
+    return D
+
+
+def fit_markov(codes, m):
+    """
+    Transition matrix estimated from a recorded code array; symbols never
+    seen as a predecessor get a uniform row.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    counts = np.zeros((m, m))
+    np.add.at(counts, (codes[:-1], codes[1:]), 1)
+    empty = counts.sum(axis=1) == 0
+    counts[empty] = 1
+    return counts / counts.sum(axis=1, keepdims=True)
+
+
+def replay(recorded, m, n, rng, order=1):
+    """
+    n symbols resampled from a recorded code array: its symbol frequencies
+    (order 0) or its first-order transition frequencies (order 1).
+    """
+    recorded = np.asarray(recorded, dtype=np.int64)
+    if order == 0:
+        p = np.bincount(recorded, minlength=m) / len(recorded)
+        return rng.choice(m, size=n, p=p)
+    return markov(fit_markov(recorded, m), n, rng, start=int(recorded[0]))
+
+
+class Adversary:
+    """
+    Buffer-maximising walks over the product of a DFA set.
+
+    Over the compiled product, L is the set of non-accepting states that
+    can still reach acceptance. S, the largest subset of L in which every
+    state has a successor in S, is where a trace can buffer forever; the
+    rest of L is acyclic, and height(q) is the longest stay in L from q.
+    At every state the walk picks uniformly among the symbols leading to
+    the highest successor (S counts as infinite, accepting as 0).
+
+    Dead states, from which acceptance is unreachable, are avoided when
+    the enforcer drops its buffer there (strict enforcers). With
+    trap_buffers set (least-effort and exclusive enforcers keep buffering
+    forever in a trap) they count as infinite instead. max_states caps the
+    product as for the monolithic enforcers (MemoryError beyond it).
+    """
+
+    def __init__(self, dfas, accept="and", trap_buffers=False, max_states=None):
+        if len(dfas) == 1:
+            P = dfas[0]
+        else:
+            combine = product_and if accept == "and" else product_or
+            P = combine(*dfas, "Adversary", lazy=True, max_states=max_states)
+        P = P.compile()
+
+        # The product codes symbols in its own alphabet order (list order
+        # for list alphabets); walks emit codes into the sorted alphabet
+        position = {a: i for i, a in enumerate(sorted(P.symbols))}
+        self.label = [position[a] for a in P.symbols]
+
+        self.q0 = P.q0_code
+        n, table = P.n_symbols, P.table
+        Q = len(P.states)
+        live = P.coreachable()
+        L = [live[q] and not P.accepting[q] for q in range(Q)]
+
+        succ = [
+            [table[q * n + c] for c in range(n)] for q in range(Q)
+        ]
+
+        # Greatest fixpoint: drop states of L with no successor left in S
+        preds = [[] for _ in range(Q)]
+        for q in range(Q):
+            for t in succ[q]:
+                if t >= 0:
+                    preds[t].append(q)
+        S = list(L)
+        inside = [sum(1 for t in succ[q] if t >= 0 and L[t]) for q in range(Q)]
+        stack = [q for q in range(Q) if S[q] and not inside[q]]
+        for q in stack:
+            S[q] = False
+        while stack:
+            t = stack.pop()
+            for q in preds[t]:
+                if S[q]:
+                    inside[q] -= 1
+                    if not inside[q]:
+                        S[q] = False
+                        stack.append(q)
+
+        # height: -1 dead, 0 accepting, longest stay in L, inf inside S.
+        # L minus S is acyclic, so a post-order DFS settles it.
+        inf = float("inf")
+        dead = inf if trap_buffers else -1
+        height = [
+            dead if not live[q] else inf if S[q] else 0 if not L[q] else None
+            for q in range(Q)
+        ]
+        for root in range(Q):
+            if height[root] is not None:
+                continue
+            stack = [root]
+            while stack:
+                q = stack[-1]
+                todo = [t for t in succ[q] if t >= 0 and height[t] is None]
+                if todo:
+                    stack.extend(todo)
+                    continue
+                stack.pop()
+                if height[q] is None:
+                    height[q] = 1 + max(dead if t < 0 else height[t] for t in succ[q])
+
+        def h(t):
+            return dead if t < 0 else height[t]
+
+        self.best = []
+        for q in range(Q):
+            scores = [h(t) for t in succ[q]]
+            top = max(scores)
+            self.best.append([c for c, s in enumerate(scores) if s == top])
+
+        self.succ = succ
+        self.n_symbols = n
+        self.trap_buffers = trap_buffers
+
+    def walk(self, n, rng):
+        best, succ, label = self.best, self.succ, self.label
+        u = rng.random(n)
+        out = np.empty(n, dtype=np.int64)
+        q = self.q0
+        for t, x in enumerate(u.tolist()):
+            choices = best[q]
+            c = choices[int(x * len(choices))]
+            out[t] = label[c]
+            q = succ[q][c]
+            if q < 0:
+                if self.trap_buffers:
+                    # Stuck for good: every further event is buffered
+                    out[t + 1:] = (u[t + 1:] * self.n_symbols).astype(np.int64)
+                    break
+                # Every move from here was undefined: restart the walk
+                q = self.q0
+        return out
+
+
+WORKLOADS = ("uniform", "markov", "bursty", "replay", "adversarial")
+
+
+def sampler(workload, dfas, accept="and", seed=0, recorded=None,
+            trap_buffers=False, max_states=None):
+    """
+    draw(n, rep) -> code array for the named workload over the alphabet of
+    dfas. Models (Markov matrix, bursts, product analysis) are built once
+    from the seed; each draw uses its own (seed, n, rep) stream. recorded
+    is the symbol list replay resamples; accept and trap_buffers describe
+    the enforcer for adversarial traces (see Adversary), max_states caps
+    their product.
+    """
+    symbols = sorted(dfas[0].S)
+    m = len(symbols)
+    model_rng = np.random.default_rng([seed, 0x5EED])
+
+    if workload == "uniform":
+        return lambda n, rep: uniform(m, n, rng_for(seed, n, rep))
+
+    if workload == "markov":
+        P = random_markov(m, model_rng)
+        return lambda n, rep: markov(P, n, rng_for(seed, n, rep))
+
+    if workload == "bursty":
+        D = burst_distributions(m)
+        return lambda n, rep: bursty(D, n, rng_for(seed, n, rep))
+
+    if workload == "replay":
+        if not recorded:
+            raise ValueError("replay needs a recorded trace")
+        code = {a: c for c, a in enumerate(symbols)}
+        codes = np.asarray([code[a] for a in recorded], dtype=np.int64)
+        return lambda n, rep: replay(codes, m, n, rng_for(seed, n, rep))
+
+    if workload == "adversarial":
+        adversary = Adversary(dfas, accept, trap_buffers, max_states)
+        return lambda n, rep: adversary.walk(n, rng_for(seed, n, rep))
+
+    raise ValueError(f"Unknown workload: {workload}")
@@ -22,18 +22,30 @@ plt.rcParams.update({
 })
 
 # ==============================
-# Read CSV
+# Read CSV (written by performance_eval.py)
 # ==============================
 
+# enforcer -> [(input size, median, CI low, CI high)] in seconds, for the
+# largest property count benchmarked; failed cases are skipped
 data = defaultdict(list)
+props = {}
 
-with open("performance_results_avg_opt.csv", "r") as f:
+with open("performance_bench.csv", "r") as f:
     reader = csv.DictReader(f)
-    for row in reader:
-        enforcer = row["Enforcer"].strip()
-        size = int(row["Input Size"])
-        time_val = float(row["Average Time (s)"])
-        data[enforcer].append((size, time_val))
+    rows = [row for row in reader if row["status"] == "ok"]
+
+for row in rows:
+    enforcer = row["enforcer"].strip()
+    props[enforcer] = max(props.get(enforcer, 0), int(row["properties"]))
+
+for row in rows:
+    enforcer = row["enforcer"].strip()
+    if int(row["properties"]) != props[enforcer]:
+        continue
+    size = int(row["input_size"])
+    median, low, high = (float(row[f"run_{stat}_ns"]) / 1e9
+                         for stat in ("median", "ci_low", "ci_high"))
+    data[enforcer].append((size, median, low, high))
 
 for k in data:
     data[k] = sorted(data[k], key=lambda x: x[0])
@@ -75,6 +87,15 @@ def style_for(enforcer_name):
         return STYLE_SERIAL
     return {}
 
+
+def plot_enforcer(enf):
+    # Median with its 95% confidence interval as a band
+    x = [p[0] for p in data[enf]]
+    style = style_for(enf)
+    plt.plot(x, [p[1] for p in data[enf]], label=enf, **style)
+    plt.fill_between(x, [p[2] for p in data[enf]], [p[3] for p in data[enf]],
+                     color=style.get("color"), alpha=0.2)
+
 # ==============================
 # Plotting
 # ==============================
@@ -91,14 +112,12 @@ for title, enforcer_list in groups.items():
                 print(f"WARNING: No data for {enf}")
                 continue
 
-            x = [p[0] for p in data[enf]]
-            y = [p[1] for p in data[enf]]
-            plt.plot(x, y, label=enf, **style_for(enf))
+            plot_enforcer(enf)
             plotted = True
 
         if plotted:
             plt.xlabel("Input Size (Number of Events)")
-            plt.ylabel("Total Time (seconds)")
+            plt.ylabel("Median Time (seconds)")
             plt.title("Strict Enforcers")
 
             plt.ylim(-0.1, 0.5)
@@ -106,7 +125,7 @@ for title, enforcer_list in groups.items():
 
             plt.grid(True, linestyle="--", alpha=0.6)
             plt.legend()
-            plt.savefig("strict_enforcers_1_avg.png")
+            plt.savefig("strict_enforcers_1_bench.png")
             plt.show()
         else:
             plt.close()
@@ -120,19 +139,17 @@ for title, enforcer_list in groups.items():
             print(f"WARNING: No data for {enf}")
             continue
 
-        x = [p[0] for p in data[enf]]
-        y = [p[1] for p in data[enf]]
-        plt.plot(x, y, label=enf, **style_for(enf))
+        plot_enforcer(enf)
         plotted = True
 
     if plotted:
         plt.xlabel("Input Size (Number of Events)")
-        plt.ylabel("Total Time (seconds)")
+        plt.ylabel("Median Time (seconds)")
         plt.title(title)
         plt.grid(True, linestyle="--", alpha=0.6)
         plt.legend()
 
-        filename = title.lower().replace(" ", "_") + "_avg.png"
+        filename = title.lower().replace(" ", "_") + "_bench.png"
         plt.savefig(filename)
         plt.show()
         print(f"Saved {filename}")
@@ -73,27 +73,12 @@ def generate_input(alphabet, n):
     return [random.choice(alphabet) for _ in range(n)]
 
 
-def time_enforcer(enf, enf_type, input_list):
+def time_enforcer(enf, input_list):
+    # Every run starts from the initial configuration; strict enforcers
+    # would otherwise stay in drop mode after the first dead state
+    enf.reset()
     t0 = time.perf_counter()
-
-    if enf_type in {
-        "strict_monolithic",
-        "strict_serial",
-        "strict_parallel",
-        "exclusive_monolithic",
-        "exclusive_parallel",
-    }:
-        for a in input_list:
-            enf.step(a)
-
-    elif enf_type == "LE_monolithic":
-        for a in input_list:
-            enf(a)
-
-    elif enf_type == "LE_parallel":
-        for a in input_list:
-            enf.process_event(a)
-
+    enf.feed_many(input_list)
     return (time.perf_counter() - t0) * 1_000_000  # microseconds
 
 # -------------------------------------------------
@@ -134,38 +119,31 @@ for name in ENFORCER_ORDER:
             if name == "Strict_Monolithic":
                 enf = StrictMonolithicEnforcer(strict_mono_dfas)
                 alphabet = list(strict_mono_dfas[0].S)
-                enf_type = "strict_monolithic"
 
             elif name == "Strict_Serial":
                 enf = StrictSerialEnforcer(strict_serial_dfas)
                 alphabet = list(strict_serial_dfas[0].S)
-                enf_type = "strict_serial"
 
             elif name == "Strict_Parallel":
                 enf = StrictParallelEnforcer(strict_parallel_dfas)
                 alphabet = list(strict_parallel_dfas[0].S)
-                enf_type = "strict_parallel"
 
             elif name == "LE_Monolithic":
                 enf = least_effort_monolithic_enforcer("LE", *le_mono_dfas)
                 alphabet = list(le_mono_dfas[0].S)
-                enf_type = "LE_monolithic"
 
             elif name == "LE_Parallel":
                 enf = LeastEffortParallelEnforcer(le_parallel_dfas)
                 alphabet = list(le_parallel_dfas[0].S)
-                enf_type = "LE_parallel"
 
             elif name == "Exclusive_Monolithic":
-                exclusive_mono_dfa = product(*exclusive_dfas, "Exclusive_Mono")
+                exclusive_mono_dfa = product(*exclusive_dfas, "Exclusive_Mono", lazy=True)
                 enf = ExclusiveMonolithicEnforcer(exclusive_mono_dfa)
                 alphabet = list(exclusive_dfas[0].S)
-                enf_type = "exclusive_monolithic"
 
             elif name == "Exclusive_Parallel":
                 enf = ExclusiveParallelEnforcer(exclusive_dfas)
                 alphabet = list(exclusive_dfas[0].S)
-                enf_type = "exclusive_parallel"
 
         except MemoryError:
             print(f"{name} | {k} properties | MEMORY ERROR (state explosion)")
@@ -175,13 +153,13 @@ for name in ENFORCER_ORDER:
         # Run experiment NUM_RUNS times and average
         # -------------------------------------------------
 
-        _ = time_enforcer(enf, enf_type, generate_input(alphabet, INPUT_SIZE))
+        _ = time_enforcer(enf, generate_input(alphabet, INPUT_SIZE))
 
         times = []
 
         for _ in range(NUM_RUNS):
             seq = generate_input(alphabet, INPUT_SIZE)
-            t = time_enforcer(enf, enf_type, seq)
+            t = time_enforcer(enf, seq)
             times.append(t)
 
         avg_time = sum(times) / NUM_RUNS
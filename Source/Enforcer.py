@@ -7,13 +7,11 @@ import time
 
 #### Function to pre-compute emptiness check for each state in the given automaton ###############
 def computeEmptinessDict(autC):
+    autC.compile(complete=True)
+    live = autC.coreachable()
     dictEnf = {}
-    for state in autC.Q:
-        autC.makeInit(state)
-        if autC.isEmpty():
-            dictEnf[state] = True
-        else:
-            dictEnf[state] = False
+    for code, state in enumerate(autC.states):
+        dictEnf[state] = not live[code]
     return dictEnf
 
 #### Function to compute substring of sigmaC by removing smallest cycle in sigmaC ###############
@@ -3,76 +3,97 @@
 exclusive_mono.py
 """
 
-class ExclusiveMonolithicEnforcer:
+from Source.streaming import StreamingEnforcer
+
+
+class ExclusiveMonolithicEnforcer(StreamingEnforcer):
 
     def __init__(self, dfa):
 
-        self.dfa = dfa
-        self.q = dfa.q0          # committed state
+        self.dfa = dfa.compile()
+        self.q = self.dfa.q0_code  # committed state (integer code)
+        self.t = self.q            # tentative state δ*(q, σ_c), -1 if undefined
         self.sigma_c = []        # buffer σ_c
         self.output = []         # global output
 
     def _compute_tentative_state(self):
-       
-        temp = self.q
-        for a in self.sigma_c:
-            temp = self.dfa.d(temp, a)
-            if temp is None:
-                break
-        return temp
+
+        if self.t < 0:
+            return None
+        return self.dfa.state_label(self.dfa.states[self.t])
 
     def step(self, a):
 
         # Safety check
-        if a not in self.dfa.S:
+        c = self.dfa.symbol_code.get(a)
+        if c is None:
             raise ValueError(f"Invalid input symbol: {a}")
-        
+
         # Append event to buffer
         self.sigma_c.append(a)
 
-        temp_state = self.q
-
-        # Scan prefixes of σ_c
-        for i, sym in enumerate(self.sigma_c):
-            temp_state = self.dfa.d(temp_state, sym)
+        # No earlier prefix of σ_c was accepting, so only σ_c·a needs
+        # checking: one transition from the tentative state
+        if self.t < 0:
+            return []
+        self.t = self.dfa.step_code(self.t, c)
 
-            if temp_state is None:
-                break
+        # Accepting prefix found
+        if self.t >= 0 and self.dfa.accepting[self.t]:
+            # Commit state and hand the buffer off as the release
+            released = self.sigma_c
+            self.q = self.t
+            self.sigma_c = []
 
-            # Accepting prefix found
-            if self.dfa.F(temp_state):
-                released = self.sigma_c[:i+1]
+            # Save output
+            self.output.extend(released)
 
-                # Commit state
-                self.q = temp_state
-
-                # Clear buffer
-                self.sigma_c = []
-
-                # Save output
-                self.output.extend(released)
-
-                return released
+            return released
 
         return []
 
-    def enforce(self, input_word):
+    def feed_many(self, input_word):
 
-        # Enforce a complete input trace.
+        # Same as step() per event, in one tight loop
+        code = self.dfa.symbol_code
+        table = self.dfa.table
+        n = self.dfa.n_symbols
+        accepting = self.dfa.accepting
+
+        t = self.t
+        sigma_c = self.sigma_c
         out = []
+
         for a in input_word:
-            released = self.step(a)
-            if released:
-                out.extend(released)
+            c = code.get(a)
+            if c is None:
+                self.t = t
+                self.output.extend(out)
+                raise ValueError(f"Invalid input symbol: {a}")
+            sigma_c.append(a)
+            if t < 0:
+                continue
+            t = table[t * n + c]
+            if t >= 0 and accepting[t]:
+                out.extend(sigma_c)
+                sigma_c.clear()
+                self.q = t
+
+        self.t = t
+        self.output.extend(out)
         return out
 
     def reset(self):
         
         # Reset enforcer state.
-        self.q = self.dfa.q0
+        self.q = self.dfa.q0_code
+        self.t = self.q
         self.sigma_c = []
         self.output = []
 
     def debug_state(self):
 
-        return self._compute_tentative_state(), self.q
+        return (
+            self._compute_tentative_state(),
+            self.dfa.state_label(self.dfa.states[self.q]),
+        )
@@ -17,8 +17,8 @@ Your desired semantics (accumulating σs and global release when all match):
 - Global release rule (WHAT YOU WANT):
     If all σs_i are identical, emit ONLY the new suffix that hasn't been globally emitted yet.
 
-This is compatible with output_exclusive_parallel.py (same class name, step() signature,
-and debug keys). It intentionally differs from Algorithm 7's step-proposal σs semantics.
+This is compatible with output_exclusive_parallel.py (same class name, step_debug()
+signature, and debug keys). It intentionally differs from Algorithm 7's step-proposal σs semantics.
 """
 
 import sys
@@ -26,27 +26,22 @@ import os
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from helper.Automata import DFA
+from Source.streaming import StreamingEnforcer
 
 
-def dfa_run(dfa: DFA, q, word):
-    for a in word:
-        q = dfa.d(q, a)
-    return q
-
-
-def dfa_accepts_from(dfa: DFA, q, word):
-    q_end = dfa_run(dfa, q, word)
-    return dfa.F(q_end), q_end
-
-
-class ExclusiveParallelEnforcer:
+class ExclusiveParallelEnforcer(StreamingEnforcer):
     def __init__(self, dfa_list):
-        self.dfas = dfa_list
+        self.dfas = [dfa.compile() for dfa in dfa_list]
         self.n = len(dfa_list)
 
+        self.reset()
+
+    def reset(self):
         # qi: state reached by events that have been locally accepted & appended into σs_i
-        self.q = [dfa.q0 for dfa in self.dfas]
+        self.q = [dfa.q0_code for dfa in self.dfas]
+
+        # ti: tentative state δ'*(qi, σc_i), -1 once undefined
+        self.t = list(self.q)
 
         # σc_i: pending (not yet locally accepted)
         self.sigma_c = [[] for _ in range(self.n)]
@@ -54,60 +49,59 @@ class ExclusiveParallelEnforcer:
         # σs_i: persistent "output so far" per enforcer (what you want to see/compare)
         self.sigma_s = [[] for _ in range(self.n)]
 
-    def reset(self):
-        self.q = [dfa.q0 for dfa in self.dfas]
-        self.sigma_c = [[] for _ in range(self.n)]
-        self.sigma_s = [[] for _ in range(self.n)]
-
-    def step(self, a):
+    def snapshot(self):
         """
-        Process one event a and return (output_list, debug_info_list).
-
-        Debug keys match your driver:
+        Debug view of every enforcer, built only when asked for:
           { "enforcer": i+1, "σc": [...], "σs": [...], "state": qi }
         """
+        debug_info = []
+        for i in range(self.n):
+            debug_info.append({
+                "enforcer": i + 1,
+                "σc": list(self.sigma_c[i]),
+                "σs": list(self.sigma_s[i]),
+                "state": self.dfas[i].states[self.q[i]],
+            })
+        return debug_info
 
-        # Optional snapshot if caller passes empty string
-        if a == "":
-            debug_info = []
-            for i in range(self.n):
-                debug_info.append({
-                    "enforcer": i + 1,
-                    "σc": list(self.sigma_c[i]),
-                    "σs": list(self.sigma_s[i]),
-                    "state": self.q[i],
-                })
-            return [], debug_info
+    def step_debug(self, a):
+        """
+        Interactive path: process a (an empty string only inspects) and
+        return (output_list, debug_info_list).
+        """
+        output = self.step(a) if a != "" else []
+        debug_info = self.snapshot()
+        if output:
+            # Show σs as it was just before the global release cleared it
+            for info in debug_info:
+                info["σs"] = list(output)
+        return output, debug_info
 
-        debug_info = []
+    def step(self, a):
+        """
+        Process one event a and return the globally released events.
+        """
 
         # ----------------------------
         # Local update for each enforcer
         # ----------------------------
         for i in range(self.n):
             dfa = self.dfas[i]
-            qi = self.q[i]
             buf = self.sigma_c[i]
+            buf.append(a)  # σc_i · a
 
-            word = buf + [a]  # σc_i · a
-            accepts, q_end = dfa_accepts_from(dfa, qi, word)
+            # One transition from δ'*(qi, σc_i) instead of rerunning σc_i · a
+            ti = self.t[i]
+            if ti >= 0:
+                ti = dfa.step_code(ti, dfa.symbol_code[a])
+            self.t[i] = ti
 
-            if accepts:
+            if ti >= 0 and dfa.accepting[ti]:
                 # Locally accept the buffered chunk and append to persistent σs_i
-                self.sigma_s[i].extend(word)
+                self.sigma_s[i].extend(buf)
                 self.sigma_c[i] = []
-                self.q[i] = q_end
-            else:
-                # Keep buffering
-                self.sigma_c[i] = word
-                # qi unchanged, sigma_s unchanged
-
-            debug_info.append({
-                "enforcer": i + 1,
-                "σc": list(self.sigma_c[i]),
-                "σs": list(self.sigma_s[i]),
-                "state": self.q[i],
-            })
+                self.q[i] = ti
+            # otherwise keep buffering; qi and sigma_s unchanged
 
         # ----------------------------
         # ----------------------------
@@ -127,19 +121,7 @@ class ExclusiveParallelEnforcer:
             # Clear σs after global release (your requirement)
             for i in range(self.n):
                 self.sigma_s[i] = []
-
-            # Also reset global pointer (not needed anymore, but safe)
-            self.global_emitted_len = 0
         else:
             output = []
 
-        return list(output), debug_info
-
-
-    def enforce(self, input_word):
-        out = []
-        for a in input_word:
-            emitted, _ = self.step(a)
-            if emitted:
-                out.extend(emitted)
-        return out
+        return output
@@ -9,128 +9,165 @@ import os
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 from helper.Automata import DFA
+from Source.streaming import StreamingEnforcer
 
 
 # --------------------------------------------------
 # DFA utilities
 # --------------------------------------------------
 
-def dfa_run(dfa: DFA, q, word):
+def moving_symbols(dfa: DFA):
     """
-    Run DFA from state q over a word (list of symbols).
-    Returns the resulting state.
+    For every state code of a compiled DFA, the symbol codes on which it
+    is not a self-loop. For an exclusive-modified DFA a don't-care state
+    moves only on its own deciding events, so this is the deciding-set
+    routing of Algorithm 7 read straight off the transition table.
     """
-    for a in word:
-        q = dfa.d(q, a)
-    return q
-
-
-def dfa_accepts_from(dfa: DFA, q, word):
-    """
-    Check whether DFA accepts when starting from state q
-
-    Returns:
-        (accepts: bool, q_end: state)
-    """
-    q_end = dfa_run(dfa, q, word)
-    return dfa.F(q_end), q_end
+    table, n = dfa.table, dfa.n_symbols
+    return [
+        tuple(a for a in range(n) if table[q * n + a] != q)
+        for q in range(len(dfa.states))
+    ]
 
 
 # --------------------------------------------------
 # Exclusive Parallel Enforcer
 # --------------------------------------------------
 
-class ExclusiveParallelEnforcer:
+class ExclusiveParallelEnforcer(StreamingEnforcer):
+    """
+    Every event goes either to σc_i or, with σc_i, to σs_i, so
+    σs_i · σc_i is the same log for every enforcer i since the last global
+    release. The log is kept once; enforcer i only records the offset
+    where its σc_i starts, and only while σc_i is pending.
+
+    An enforcer whose tentative state self-loops on an event keeps both
+    its state and its pending status, so per event only the enforcers
+    routed to that symbol are touched, and the global release check is a
+    count of pending enforcers.
+    """
+
     def __init__(self, dfa_list):
         
         # Initialize the exclusive parallel enforcer.
 
-        self.dfas = dfa_list
+        self.dfas = [dfa.compile(complete=True) for dfa in dfa_list]
         self.n = len(dfa_list)
 
-        # q_i : DFA state after all events in σs_i
-        self.q = [dfa.q0 for dfa in self.dfas]
+        # Shared alphabet: one symbol coding for all enforcers
+        self.symbol_code = self.dfas[0].symbol_code
+        for dfa in self.dfas:
+            assert dfa.symbols == self.dfas[0].symbols, "Alphabets must match!"
 
-        # σc_i : local pending buffer (not yet accepted)
-        self.sigma_c = [[] for _ in range(self.n)]
+        self.moves = [moving_symbols(dfa) for dfa in self.dfas]
 
-        # σs_i : locally accepted output (accumulating)
-        self.sigma_s = [[] for _ in range(self.n)]
+        self.reset()
 
     def reset(self):
         # Reset all enforcers to initial configuration.
-        self.q = [dfa.q0 for dfa in self.dfas]
-        self.sigma_c = [[] for _ in range(self.n)]
-        self.sigma_s = [[] for _ in range(self.n)]
 
-    def step(self, a):
+        # q_i : DFA state after all events in σs_i
+        self.q = [dfa.q0_code for dfa in self.dfas]
 
-        if a == "":
-            debug_info = []
-            for i in range(self.n):
-                debug_info.append({
-                    "enforcer": i + 1,
-                    "σc": list(self.sigma_c[i]),
-                    "σs": list(self.sigma_s[i]),
-                    "state": self.q[i],
-                })
-            return [], debug_info
+        # t_i : tentative state after σs_i · σc_i
+        self.t = list(self.q)
 
-        debug_info = []
+        # σ since the last global release, shared by all enforcers
+        self.log = []
 
-        # Local update for each enforcer
-        for i in range(self.n):
-            dfa = self.dfas[i]
-            qi = self.q[i]
-            buf = self.sigma_c[i]
+        # i -> start of σc_i in the log, for enforcers not in F'_i
+        self.offset = {}
 
-            # Candidate chunk: σc_i · a
-            word = buf + [a]
+        # symbol code -> enforcers whose tentative state moves on it
+        self.routes = [set() for _ in self.symbol_code]
 
-            accepts, q_end = dfa_accepts_from(dfa, qi, word)
+        for i, dfa in enumerate(self.dfas):
+            for c in self.moves[i][self.t[i]]:
+                self.routes[c].add(i)
+            if not dfa.accepting[self.t[i]]:
+                self.offset[i] = 0
 
-            if accepts:
-                # Locally accepted:
-                #   append to σs_i
-                #   clear σc_i
-                #   advance DFA state
-                self.sigma_s[i].extend(word)
-                self.sigma_c[i] = []
-                self.q[i] = q_end
-            else:
-                # Still unsafe — keep buffering
-                self.sigma_c[i] = word
-
-            # Collect debug info after local step
+    @property
+    def sigma_c(self):
+        # σc_i : local pending buffer (not yet accepted)
+        return [
+            self.log[self.offset[i]:] if i in self.offset else []
+            for i in range(self.n)
+        ]
+
+    @property
+    def sigma_s(self):
+        # σs_i : locally accepted output (accumulating)
+        return [
+            self.log[:self.offset.get(i, len(self.log))]
+            for i in range(self.n)
+        ]
+
+    def snapshot(self):
+        """
+        Debug view of every enforcer, built only when asked for:
+          { "enforcer": i+1, "σc": [...], "σs": [...], "state": qi }
+        """
+        debug_info = []
+        for i in range(self.n):
             debug_info.append({
                 "enforcer": i + 1,
                 "σc": list(self.sigma_c[i]),
                 "σs": list(self.sigma_s[i]),
-                "state": self.q[i],
+                "state": self.dfas[i].states[self.q[i]],
             })
+        return debug_info
 
-        # --------------------------------------------
-        # GLOBAL RELEASE OPTIMIZATION
-        # --------------------------------------------
+    def step_debug(self, a):
+        """
+        Interactive path: process a (an empty string only inspects) and
+        return (output_list, debug_info_list).
+        """
+        output = self.step(a) if a != "" else []
+        debug_info = self.snapshot()
+        if output:
+            # Show σs as it was just before the global release cleared it
+            for info in debug_info:
+                info["σs"] = list(output)
+        return output, debug_info
+
+    def step(self, a):
 
-        if all(len(c) == 0 for c in self.sigma_c):
-            output = list(self.sigma_s[0])  # representative output
+        c = self.symbol_code[a]
+        log = self.log
+        log.append(a)
 
-            # Clear σs after global release
-            for i in range(self.n):
-                self.sigma_s[i] = []
+        # Local update, only for enforcers routed to a
+        for i in list(self.routes[c]):
+            dfa = self.dfas[i]
+            t = self.t[i]
+            nt = dfa.step_code(t, c)
 
-            return output, debug_info
+            for b in self.moves[i][t]:
+                self.routes[b].discard(i)
+            if nt >= 0:
+                for b in self.moves[i][nt]:
+                    self.routes[b].add(i)
 
-        return [], debug_info
+            self.t[i] = nt
 
-    def enforce(self, input_word):
-        """
-        Process a complete input word and return the enforced output.
-        """
-        out = []
-        for a in input_word:
-            emitted, _ = self.step(a)
-            if emitted:
-                out.extend(emitted)
-        return out
+            if nt >= 0 and dfa.accepting[nt]:
+                # Locally accepted:
+                #   σs_i absorbs σc_i · a
+                #   advance DFA state
+                self.q[i] = nt
+                self.offset.pop(i, None)
+            elif i not in self.offset:
+                # Still unsafe — a starts a new σc_i
+                self.offset[i] = len(log) - 1
+
+        # --------------------------------------------
+        # GLOBAL RELEASE OPTIMIZATION
+        # --------------------------------------------
+
+        if not self.offset:
+            # Every σs_i equals the log: release it
+            self.log = []
+            return log
+
+        return []
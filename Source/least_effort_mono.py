@@ -8,59 +8,122 @@ import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from helper.product import product_or
+from Source.streaming import StreamingEnforcer
 
-def least_effort_monolithic_enforcer(name, *D):
 
-    assert len(D) > 0
+class LeastEffortMonolithicEnforcer(StreamingEnforcer):
 
-    # OR-product DFA
-    if len(D) == 1:
-        product_dfa = D[0]
-    else:
-        product_dfa = product_or(D[0], D[1], name)
-        for i in range(2, len(D)):
-            product_dfa = product_or(product_dfa, D[i], name)
+    def __init__(self, name, *D, max_states=None):
 
-    q = product_dfa.q0
-    sigma_c = []
+        assert len(D) > 0
 
-    def process_event(a, debug=False):
-        nonlocal q, sigma_c
+        # OR-product DFA (reachable states only), minimised after each
+        # pairwise step
+        if len(D) == 1:
+            product_dfa = D[0]
+        else:
+            product_dfa = product_or(
+                D[0], D[1], name, lazy=True, max_states=max_states
+            ).minimize()
+            for i in range(2, len(D)):
+                product_dfa = product_or(
+                    product_dfa, D[i], name, lazy=True, max_states=max_states
+                ).minimize()
 
-        # flushing remaining buffer
-        if a is None:
-            if sigma_c:
-                released = sigma_c.copy()
-                sigma_c = []
-                if debug:
-                    return released, sigma_c.copy()
-                return released
-            return [] if not debug else ([], sigma_c.copy())
+        self.dfa = product_dfa.compile()
+
+        self.q = self.dfa.q0_code  # committed state (integer code)
+        self.t = self.q            # tentative state δ*(q, σ_c), -1 if undefined
+        self.sigma_c = []
+        self.output = []
+
+    def step(self, a):
 
         # append event
-        sigma_c.append(a)
-        temp_state = q
+        self.sigma_c.append(a)
+
+        # earlier prefixes of σ_c were already rejected, so one
+        # transition from the tentative state decides σ_c·a
+        if self.t < 0:
+            return []
+        self.t = self.dfa.step_code(self.t, self.dfa.symbol_code[a])
+
+        if self.t >= 0 and self.dfa.accepting[self.t]:
+            # releasing the buffer
+            released = self.sigma_c
+            self.sigma_c = []
+            self.q = self.t
+            self.output.extend(released)
+            return released
+
+        return []
+
+    def flush(self):
+
+        # flushing remaining buffer
+        released = self.sigma_c
+        self.sigma_c = []
+        self.t = self.q
+        self.output.extend(released)
+        return released
+
+    def feed_many(self, input_word):
+
+        # Same as step() per event, in one tight loop
+        code = self.dfa.symbol_code
+        table = self.dfa.table
+        n = self.dfa.n_symbols
+        accepting = self.dfa.accepting
+
+        t = self.t
+        sigma_c = self.sigma_c
+        out = []
+
+        for a in input_word:
+            sigma_c.append(a)
+            if t < 0:
+                continue
+            t = table[t * n + code[a]]
+            if t >= 0 and accepting[t]:
+                out.extend(sigma_c)
+                sigma_c.clear()
+                self.q = t
+
+        self.t = t
+        self.output.extend(out)
+        return out
+
+    def reset(self):
+
+        self.q = self.dfa.q0_code
+        self.t = self.q
+        self.sigma_c = []
+        self.output = []
+
+    def snapshot(self):
+
+        label = self.dfa.state_label
+        return {
+            "state": label(self.dfa.states[self.q]),
+            "tentative": None if self.t < 0 else label(self.dfa.states[self.t]),
+            "σc": list(self.sigma_c),
+        }
+
+    def __call__(self, a, debug=False):
+
+        # Closure-style interface: None flushes the buffer
+        released = self.flush() if a is None else self.step(a)
+        if debug:
+            return released, list(self.sigma_c)
+        return released
 
-        # checking acceptance incrementally
-        for i, sym in enumerate(sigma_c):
-            temp_state = product_dfa.d(temp_state, sym)
-            if temp_state is None:
-                break
-            if product_dfa.F(temp_state):
-                # releasing prefix
-                released = sigma_c[:i+1]
-                sigma_c = []
-                q = temp_state
-                if debug:
-                    return released, sigma_c.copy()
-                return released
 
-        return [] if not debug else ([], sigma_c.copy())
+def least_effort_monolithic_enforcer(name, *D, max_states=None):
 
-    return process_event
+    return LeastEffortMonolithicEnforcer(name, *D, max_states=max_states)
 
 
 # Optional alias:
-def least_effort_mono(name, *D):
+def least_effort_mono(name, *D, max_states=None):
 
-    return least_effort_monolithic_enforcer(name, *D)
+    return least_effort_monolithic_enforcer(name, *D, max_states=max_states)
@@ -8,53 +8,77 @@ import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from helper.product import DFA
+from Source.streaming import StreamingEnforcer
 
-class LeastEffortParallelEnforcer:
+class LeastEffortParallelEnforcer(StreamingEnforcer):
 
     def __init__(self, enforcers):
-        self.enforcers = enforcers
+        self.enforcers = [dfa.compile() for dfa in enforcers]
         self.n = len(enforcers)
 
-        # current DFA states + candidate buffers
-        self.q = [dfa.q0 for dfa in enforcers]
-        self.candidate = [[] for _ in enforcers]
+        self.reset()
+
+    def reset(self):
+
+        # committed DFA states (integer codes)
+        self.q = [dfa.q0_code for dfa in self.enforcers]
+
+        # every enforcer buffers the same events and all are released
+        # together, so one shared pending log serves as each candidate
+        # buffer; t[i] = δ*(q[i], pending) is enforcer i's cursor into it
+        self.pending = []
+        self.t = list(self.q)
 
         self.output = []
 
-    def process_event(self, a):
+    @property
+    def candidate(self):
+        return [self.pending] * self.n
 
-        # appending event to each enforcer's buffer
-        for i in range(self.n):
-            self.candidate[i].append(a)
+    def process_event(self, a):
 
-        safe_sequences = []
+        # one append to the shared log
+        self.pending.append(a)
 
+        # one transition per enforcer
+        safe = False
+        t = self.t
         for i, dfa in enumerate(self.enforcers):
-            if dfa.is_safe(self.q[i], self.candidate[i]):
-                safe_sequences.append((i, self.candidate[i].copy()))
+            ti = t[i]
+            if ti < 0:
+                continue
+            ti = dfa.step_code(ti, dfa.symbol_code[a])
+            t[i] = ti
+            if ti >= 0 and dfa.accepting[ti]:
+                safe = True
 
         # if any enforcer can release
-        if safe_sequences:
-            released = []
-
+        if safe:
             # OR-merge: maintain order, avoid duplicates
-            for idx, seq in safe_sequences:
-                for sym in seq:
-                    if sym not in released:
-                        released.append(sym)
+            released = list(dict.fromkeys(self.pending))
 
             # appending to global output
             self.output.extend(released)
 
-            # updating DFA states and reset local buffers
-            for i in range(self.n):
-                self.q[i] = self.enforcers[i].next_state(self.q[i], self.candidate[i])
-                self.candidate[i] = []
+            # committing DFA states and starting a fresh log
+            self.q = list(t)
+            self.pending = []
 
             return released
 
         return []
 
+    step = process_event
+
+    def flush(self):
+
+        # releasing the remaining log; committed states stay put
+        released = list(dict.fromkeys(self.pending))
+        self.pending = []
+        self.t = list(self.q)
+        self.output.extend(released)
+        return released
+
     def get_output(self):
         return self.output
 
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+multi_session.py
+
+Monolithic enforcement for many concurrent traces over one shared compiled
+DFA (e.g. StrictMonolithicEnforcer(dfas).dfa or an exclusive product).
+
+Per session the engine keeps one int32 state code and, only while events
+are pending, a list of buffered symbol codes. A session whose state can no
+longer reach acceptance is in drop mode, as in strict_mono.py: its buffer
+is discarded and every event it receives from then on is only counted. A batch of
+(session_id, event) pairs is advanced with NumPy: pairs are grouped by
+their rank within their session, and each rank is one vectorised table
+lookup, so events of one session are still applied in order. Ranks held
+by only a few sessions (the long tail of a session with many events in
+the batch) are stepped with a plain loop instead.
+"""
+
+import numpy as np
+
+
+class MultiSessionEnforcer:
+
+    # Ranks with fewer pairs than this are stepped one pair at a time
+    VECTOR_MIN = 32
+
+    def __init__(self, dfa, capacity=1024):
+
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
+        self.dfa = dfa.compile()
+        n_states = len(self.dfa.states)
+        n = self.dfa.n_symbols
+
+        self.symbols = self.dfa.symbols
+        self.symbol_code = self.dfa.symbol_code
+        self.n_symbols = n
+
+        # Undefined transitions go to a rejecting sink that loops on itself
+        self.sink = n_states
+        table = np.asarray(self.dfa.table, dtype=np.int32)
+        table = np.where(table >= 0, table, self.sink)
+        self.table = np.concatenate(
+            [table, np.full(n, self.sink, dtype=np.int32)]
+        )
+        self.accepting = np.concatenate(
+            [np.frombuffer(bytes(self.dfa.accepting), dtype=np.uint8), [0]]
+        ).astype(bool)
+        # Dead states (the sink included) can never reach acceptance
+        live = np.frombuffer(bytes(self.dfa.coreachable()), dtype=np.uint8)
+        self.dead = np.concatenate([live == 0, [True]])
+
+        self.rows = self.table.tolist()
+        self.accepting_list = self.accepting.tolist()
+        self.dead_list = self.dead.tolist()
+
+        self.q0 = self.dfa.q0_code
+        self.state = np.full(capacity, self.q0, dtype=np.int32)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))
+
+        # Events discarded in drop mode, per session
+        self.dropped = np.zeros(capacity, dtype=np.int64)
+
+        # session id -> buffered symbol codes (only while non-empty)
+        self.buffers = {}
+
+    def open_session(self):
+
+        if not self.free:
+            old = len(self.state)
+            self.state = np.concatenate(
+                [self.state, np.full(old, self.q0, dtype=np.int32)]
+            )
+            self.live = np.concatenate([self.live, np.zeros(old, dtype=bool)])
+            self.dropped = np.concatenate(
+                [self.dropped, np.zeros(old, dtype=np.int64)]
+            )
+            self.free = list(range(2 * old - 1, old - 1, -1))
+
+        sid = self.free.pop()
+        self.state[sid] = self.q0
+        self.live[sid] = True
+        self.dropped[sid] = 0
+        return sid
+
+    def close_session(self, sid):
+
+        # Returns whatever was still buffered, as symbols
+        self.check_sessions(np.asarray([sid], dtype=np.int64))
+        self.live[sid] = False
+        self.free.append(sid)
+        pending = self.buffers.pop(sid, [])
+        return [self.symbols[c] for c in pending]
+
+    def check_sessions(self, sessions):
+        # Every id must name an open session; KeyError names the first bad one
+        known = (sessions >= 0) & (sessions < len(self.live))
+        known[known] = self.live[sessions[known]]
+        if not known.all():
+            sid = int(sessions[np.argmin(known)])
+            raise KeyError(f"Unknown or closed session: {sid}")
+
+    def pending(self, sid):
+        return [self.symbols[c] for c in self.buffers.get(sid, [])]
+
+    def feed_codes(self, sessions, codes):
+        """
+        Advance a batch of (session id, symbol code) pairs given as two
+        equal-length arrays. Returns [(session id, released codes), ...]
+        in batch order; events of sessions in drop mode are counted in
+        dropped instead.
+        """
+        sessions = np.asarray(sessions, dtype=np.int64)
+        codes = np.asarray(codes, dtype=np.int64)
+        m = len(sessions)
+        if m == 0:
+            return []
+        self.check_sessions(sessions)
+
+        # rank of each pair among the pairs of its own session
+        order = np.argsort(sessions, kind="stable")
+        ordered = sessions[order]
+        idx = np.arange(m)
+        starts = np.ones(m, dtype=bool)
+        starts[1:] = ordered[1:] != ordered[:-1]
+        rank_sorted = idx - np.maximum.accumulate(np.where(starts, idx, 0))
+
+        # Group by rank once; counts[r] (pairs of rank r) never grows with r
+        counts = np.bincount(rank_sorted)
+        by_rank = order[np.argsort(rank_sorted, kind="stable")]
+        groups = np.split(by_rank, np.cumsum(counts)[:-1])
+        n_vector = int(np.count_nonzero(counts >= self.VECTOR_MIN))
+
+        accepted = np.empty(m, dtype=bool)
+        dead = np.empty(m, dtype=bool)
+        for sel in groups[:n_vector]:
+            sids = sessions[sel]
+            nxt = self.table[self.state[sids].astype(np.int64) * self.n_symbols
+                             + codes[sel]]
+            self.state[sids] = nxt
+            accepted[sel] = self.accepting[nxt]
+            dead[sel] = self.dead[nxt]
+
+        # Remaining ranks, session by session in batch order
+        tail = order[rank_sorted >= n_vector]
+        if len(tail):
+            rows, acc, n = self.rows, self.accepting_list, self.n_symbols
+            is_dead = self.dead_list
+            state = self.state
+            tail_sessions = sessions[tail].tolist()
+            flags = []
+            dead_flags = []
+            sid, q = None, 0
+            for s, c in zip(tail_sessions, codes[tail].tolist()):
+                if s != sid:
+                    if sid is not None:
+                        state[sid] = q
+                    sid, q = s, int(state[s])
+                q = rows[q * n + c]
+                flags.append(acc[q])
+                dead_flags.append(is_dead[q])
+            state[sid] = q
+            accepted[tail] = flags
+            dead[tail] = dead_flags
+
+        # Buffer bookkeeping in batch order keeps each session sequential
+        released = []
+        buffers = self.buffers
+        dropped = self.dropped
+        for sid, c, acc, gone in zip(sessions.tolist(), codes.tolist(),
+                                     accepted.tolist(), dead.tolist()):
+            if gone:
+                # Acceptance is unreachable: discard instead of buffering
+                buf = buffers.pop(sid, None)
+                dropped[sid] += 1 if buf is None else len(buf) + 1
+            elif acc:
+                buf = buffers.pop(sid, None)
+                if buf is None:
+                    released.append((sid, [c]))
+                else:
+                    buf.append(c)
+                    released.append((sid, buf))
+            else:
+                buffers.setdefault(sid, []).append(c)
+
+        return released
+
+    def feed(self, pairs):
+        """
+        Advance an iterable of (session id, event symbol) pairs.
+        Returns [(session id, released symbols), ...] in batch order.
+        """
+        pairs = list(pairs)
+        code = self.symbol_code
+        sessions = [sid for sid, _ in pairs]
+        codes = [code[a] for _, a in pairs]
+        symbols = self.symbols
+        return [
+            (sid, [symbols[c] for c in out])
+            for sid, out in self.feed_codes(sessions, codes)
+        ]
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+offline_prefix.py
+
+Offline monolithic enforcement of a recorded trace using all cores.
+
+Transition functions compose associatively, so the trace is cut into
+chunks and, in a process pool:
+  1. each chunk's state -> state map is computed for every state at once,
+  2. a prefix scan over the chunk maps gives the state each chunk starts in,
+  3. each chunk is replayed from its start state to find its release points.
+
+A release point is an index i where the DFA (e.g. the product built by
+StrictMonolithicEnforcer, or an exclusive product) is accepting after
+trace[i]: the buffer up to and including i is released there, exactly as
+the online monolithic enforcers do. Everything after the last release
+point stays buffered.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+
+# Per-worker copy of the compiled DFA, set once by _init_worker
+_table = None
+_accepting = None
+_n_symbols = None
+
+
+def _init_worker(table, accepting, n_symbols):
+    global _table, _accepting, _n_symbols
+    _table, _accepting, _n_symbols = table, accepting, n_symbols
+
+
+def _chunk_map(codes):
+    # Run every state through the chunk simultaneously. Runs that merge
+    # are tracked once: `current` holds the distinct states, `inverse`
+    # maps each start state to its slot.
+    n = _n_symbols
+    current = np.arange(len(_accepting), dtype=np.int64)
+    inverse = current.copy()
+    codes = codes.tolist()
+
+    for j, c in enumerate(codes):
+        current = _table[current * n + c]
+        if j % 64 == 63:
+            current, slot = np.unique(current, return_inverse=True)
+            inverse = slot[inverse]
+            if len(current) <= 8:
+                # Few enough left to finish with plain Python stepping
+                table = _table.tolist()
+                small = current.tolist()
+                for c in codes[j + 1:]:
+                    small = [table[q * n + c] for q in small]
+                current = np.asarray(small, dtype=np.int64)
+                break
+
+    return current[inverse]
+
+
+def _chunk_releases(args):
+    q, offset, codes = args
+    table = _table.tolist()
+    accepting = _accepting.tolist()
+    n = _n_symbols
+    releases = []
+    for i, c in enumerate(codes.tolist()):
+        q = table[q * n + c]
+        if accepting[q]:
+            releases.append(offset + i)
+    return np.asarray(releases, dtype=np.int64), q
+
+
+def compile_tables(dfa):
+    """
+    Flat NumPy transition table and accepting mask of a compiled DFA, with
+    undefined transitions sent to an extra rejecting sink state.
+    """
+    dfa.compile()
+    n = dfa.n_symbols
+    sink = len(dfa.states)
+    table = np.asarray(dfa.table, dtype=np.int64)
+    table = np.concatenate([np.where(table >= 0, table, sink),
+                            np.full(n, sink, dtype=np.int64)])
+    accepting = np.zeros(sink + 1, dtype=bool)
+    accepting[:sink] = np.frombuffer(bytes(dfa.accepting), dtype=np.uint8)
+    return table, accepting, n
+
+
+def offline_enforce(dfa, trace, chunk_size=1 << 20, workers=None):
+    """
+    Enforce trace (an array of symbol codes, or a sequence of symbols)
+    offline. Returns (release_points, final_state_code): release_points is
+    a sorted int64 array of trace indices at which the buffer is released,
+    so the enforced output is trace[:release_points[-1] + 1].
+    """
+    table, accepting, n = compile_tables(dfa)
+
+    if isinstance(trace, np.ndarray):
+        codes = trace.astype(np.int64, copy=False)
+    else:
+        code = dfa.symbol_code
+        codes = np.fromiter((code[a] for a in trace), dtype=np.int64,
+                            count=len(trace))
+
+    chunks = [codes[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    sink = len(dfa.states)
+
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(table, accepting, n)
+        releases, final = _chunk_releases((dfa.q0_code, 0, codes))
+        return releases, (final if final < sink else -1)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(table, accepting, n)) as pool:
+        maps = list(pool.map(_chunk_map, chunks))
+
+        # Prefix scan: start state of every chunk
+        starts = [dfa.q0_code]
+        for m in maps:
+            starts.append(int(m[starts[-1]]))
+
+        offsets = np.cumsum([0] + [len(c) for c in chunks[:-1]]).tolist()
+        releases = [r for r, _ in pool.map(_chunk_releases,
+                                            zip(starts[:-1], offsets, chunks))]
+
+    final = starts[-1]
+    return np.concatenate(releases), (final if final < sink else -1)
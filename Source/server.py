@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+server.py
+
+asyncio enforcement server. Each connection is one event stream:
+
+    1. the first frame names the enforcer for the session
+       (strict_mono, strict_serial, strict_parallel, LE_mono, LE_parallel,
+       exclusive_mono, exclusive_parallel)
+    2. every following frame is one event symbol
+    3. released events are written back, one frame each, in order
+    4. at end of input the enforcer is flushed and the connection closed
+
+Frames are either newline-terminated UTF-8 lines ("line") or a 4-byte
+big-endian length followed by that many UTF-8 bytes ("length"). Errors
+are sent as a single "!error <message>" frame before closing; with
+--max-sessions, a connection beyond that many concurrent sessions gets
+"!error Too many sessions" straight away.
+
+Every enforcer is built once at startup; a session gets a shallow copy
+with fresh state, so product DFAs and transition tables are shared by all
+sessions. Incoming data is enforced one read at a time with feed_many(),
+and the next read waits until the released events have drained to the
+client, so a slow reader throttles its own producer.
+
+    python Source/server.py --unix /tmp/enforcer.sock
+    python Source/server.py --host 127.0.0.1 --port 7000 --framing length
+"""
+
+import argparse
+import asyncio
+import copy
+import os
+import struct
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from helper.dfa_definitions import (
+    get_all_Strict_mono_dfas,
+    get_all_Strict_serial_dfas,
+    get_all_Strict_parallel_dfas,
+    get_all_LE_mono_dfas,
+    get_all_LE_parallel_dfas,
+)
+from helper.exclusive_modified_automata import get_all_exclusive_modified
+from helper.product import product
+
+from Source.least_effort_mono import LeastEffortMonolithicEnforcer
+from Source.least_effort_parallel import LeastEffortParallelEnforcer
+from Source.strict_mono import StrictMonolithicEnforcer
+from Source.strict_serial import StrictSerialEnforcer
+from Source.strict_parallel import StrictParallelEnforcer
+from Source.exclusive_mono import ExclusiveMonolithicEnforcer
+from Source.exclusive_parallel_opt import ExclusiveParallelEnforcer
+
+
+READ_SIZE = 1 << 16
+BACKLOG = 4096
+MAX_FRAME = 1 << 16
+LENGTH = struct.Struct(">I")
+
+
+# -------------------------------------------------
+# Enforcer registry
+# -------------------------------------------------
+
+def _exclusive_mono(dfas):
+    return ExclusiveMonolithicEnforcer(product(*dfas, "Exclusive_Mono", lazy=True))
+
+
+ENFORCERS = {
+    "strict_mono": (get_all_Strict_mono_dfas, StrictMonolithicEnforcer),
+    "strict_serial": (get_all_Strict_serial_dfas, StrictSerialEnforcer),
+    "strict_parallel": (get_all_Strict_parallel_dfas, StrictParallelEnforcer),
+    "LE_mono": (get_all_LE_mono_dfas,
+                lambda dfas: LeastEffortMonolithicEnforcer("LE", *dfas)),
+    "LE_parallel": (get_all_LE_parallel_dfas, LeastEffortParallelEnforcer),
+    "exclusive_mono": (get_all_exclusive_modified, _exclusive_mono),
+    "exclusive_parallel": (get_all_exclusive_modified, ExclusiveParallelEnforcer),
+}
+
+
+def load_enforcers(names, n_properties=None):
+    """
+    Build one prototype enforcer per name over the first n_properties
+    DFAs of its family (all of them if None). Returns
+    {name: (prototype, alphabet)}.
+    """
+    loaded = {}
+    for name in names:
+        if name not in ENFORCERS:
+            raise ValueError(f"Unknown enforcer: {name}")
+        load, build = ENFORCERS[name]
+        dfas = load()[:n_properties]
+        loaded[name] = (build(dfas), frozenset(dfas[0].S))
+    return loaded
+
+
+def new_session(prototype):
+    # Shares the compiled DFAs; reset() rebinds every piece of run state
+    enf = copy.copy(prototype)
+    enf.reset()
+    return enf
+
+
+# -------------------------------------------------
+# Framing
+# -------------------------------------------------
+
+class LineFraming:
+
+    def __init__(self):
+        self.buf = b""
+
+    def decode(self, data):
+        lines = (self.buf + data).split(b"\n")
+        self.buf = lines.pop()
+        if len(self.buf) > MAX_FRAME:
+            raise ValueError("Frame too long")
+        frames = []
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if line:
+                frames.append(line.decode())
+        return frames
+
+    def pending(self):
+        # An unterminated last line still counts at end of input
+        frames = [self.buf.rstrip(b"\r").decode()] if self.buf.strip() else []
+        self.buf = b""
+        return frames
+
+    @staticmethod
+    def encode(frames):
+        return "".join(f"{f}\n" for f in frames).encode()
+
+
+class LengthFraming:
+
+    def __init__(self):
+        self.buf = b""
+
+    def decode(self, data):
+        buf = self.buf + data
+        pos, end = 0, len(buf)
+        frames = []
+        while end - pos >= 4:
+            (size,) = LENGTH.unpack_from(buf, pos)
+            if size > MAX_FRAME:
+                raise ValueError("Frame too long")
+            if end - pos - 4 < size:
+                break
+            frames.append(buf[pos + 4:pos + 4 + size].decode())
+            pos += 4 + size
+        self.buf = buf[pos:]
+        return frames
+
+    def pending(self):
+        if self.buf:
+            raise ValueError("Truncated frame at end of input")
+        return []
+
+    @staticmethod
+    def encode(frames):
+        out = []
+        for f in frames:
+            data = f.encode()
+            out.append(LENGTH.pack(len(data)))
+            out.append(data)
+        return b"".join(out)
+
+
+FRAMINGS = {"line": LineFraming, "length": LengthFraming}
+
+
+# -------------------------------------------------
+# Server
+# -------------------------------------------------
+
+class EnforcementServer:
+
+    def __init__(self, enforcers, framing="line", max_sessions=None):
+        self.enforcers = enforcers
+        self.framing = FRAMINGS[framing]
+        self.max_sessions = max_sessions
+
+        # Connections currently being served
+        self.sessions = 0
+
+    async def handle(self, reader, writer):
+
+        framing = self.framing()
+        enf = None
+        alphabet = None
+
+        if self.max_sessions is not None and self.sessions >= self.max_sessions:
+            writer.write(framing.encode(["!error Too many sessions"]))
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            return
+
+        self.sessions += 1
+
+        async def send(frames):
+            if frames:
+                writer.write(framing.encode(frames))
+                await writer.drain()
+
+        try:
+            eof = False
+            while not eof:
+                data = await reader.read(READ_SIZE)
+                if data:
+                    frames = framing.decode(data)
+                else:
+                    frames = framing.pending()
+                    eof = True
+
+                if enf is None and frames:
+                    name = frames.pop(0)
+                    if name not in self.enforcers:
+                        raise ValueError(f"Unknown enforcer: {name}")
+                    prototype, alphabet = self.enforcers[name]
+                    enf = new_session(prototype)
+
+                if frames:
+                    bad = next((a for a in frames if a not in alphabet), None)
+                    if bad is not None:
+                        raise ValueError(f"Invalid input symbol: {bad}")
+                    await send(enf.feed_many(frames))
+                    # Sessions are long-lived: keep no global output
+                    output = getattr(enf, "output", None)
+                    if output:
+                        output.clear()
+
+            if enf is not None:
+                await send(enf.flush())
+
+        except (ValueError, UnicodeDecodeError) as e:
+            writer.write(framing.encode([f"!error {e}"]))
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve_unix(self, path):
+        if os.path.exists(path):
+            os.unlink(path)
+        return await asyncio.start_unix_server(self.handle, path=path,
+                                               backlog=BACKLOG)
+
+    async def serve_tcp(self, host, port):
+        return await asyncio.start_server(self.handle, host=host, port=port,
+                                          backlog=BACKLOG)
+
+
+async def main(args):
+
+    names = args.enforcers.split(",") if args.enforcers else list(ENFORCERS)
+    server = EnforcementServer(load_enforcers(names, args.properties),
+                               args.framing, args.max_sessions)
+
+    if args.unix:
+        srv = await server.serve_unix(args.unix)
+        where = args.unix
+    else:
+        srv = await server.serve_tcp(args.host, args.port)
+        where = f"{args.host}:{args.port}"
+
+    print(f"Serving {', '.join(names)} on {where} ({args.framing} framing)")
+    async with srv:
+        await srv.serve_forever()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Runtime enforcement server")
+    parser.add_argument("--unix", help="Unix socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--framing", choices=sorted(FRAMINGS), default="line")
+    parser.add_argument("--enforcers",
+                        help="comma-separated subset of: " + ", ".join(ENFORCERS))
+    parser.add_argument("--properties", type=int,
+                        help="use only the first N properties of each family")
+    parser.add_argument("--max-sessions", type=int,
+                        help="refuse connections beyond N concurrent sessions")
+
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
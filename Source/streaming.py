@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+streaming.py
+
+Common streaming interface shared by every enforcer:
+
+    feed(a)               process one event, return the events it releases
+    feed_many(events)     process a whole batch, return everything released
+    flush()               release whatever the semantics allow at end of input
+    reset()               back to the initial configuration
+    enforce_stream(it)    generator yielding each released chunk lazily
+
+Enforcers provide step(a) and reset(); feed_many() should be overridden
+with a tight loop where the enforcer has one.
+"""
+
+
+class StreamingEnforcer:
+
+    def feed(self, a):
+        return self.step(a)
+
+    def feed_many(self, events):
+        feed = self.feed
+        out = []
+        for a in events:
+            released = feed(a)
+            if released:
+                out.extend(released)
+        return out
+
+    def flush(self):
+        # Strict and exclusive enforcers never release an unaccepted buffer
+        return []
+
+    def enforce(self, input_word):
+        return self.feed_many(input_word)
+
+    def enforce_stream(self, events, flush=False):
+        """
+        Yield each non-empty release as events are pulled from the
+        iterable; with flush set, the end of input also flushes.
+        """
+        feed = self.feed
+        for a in events:
+            released = feed(a)
+            if released:
+                yield released
+        if flush:
+            released = self.flush()
+            if released:
+                yield released
@@ -8,36 +8,63 @@ import os, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from helper.product import product_and
+from Source.streaming import StreamingEnforcer
 
 
-class StrictMonolithicEnforcer:
+class StrictMonolithicEnforcer(StreamingEnforcer):
 
-    def __init__(self, dfas, name="StrictMonolithic"):
+    def __init__(self, dfas, name="StrictMonolithic", max_states=None):
         assert isinstance(dfas, list) and len(dfas) > 0, "No DFAs provided"
 
-        # Build product DFA φ1 ∧ φ2 ∧ ... ∧ φn
+        # Build product DFA φ1 ∧ φ2 ∧ ... ∧ φn (reachable states only),
+        # minimising after each pairwise step
         combined = dfas[0]
         for i in range(1, len(dfas)):
-            combined = product_and(combined, dfas[i], name)
+            combined = product_and(
+                combined, dfas[i], name, lazy=True, max_states=max_states
+            ).minimize()
 
-        self.dfa = combined
+        self.dfa = combined.compile()
 
-        # Current DFA state and buffer
-        self.q = self.dfa.q0
+        # States from which acceptance is still reachable
+        self.live = self.dfa.coreachable()
+
+        self.reset()
+
+    def reset(self):
+
+        # Current DFA state (integer code) and buffer
+        self.q = self.dfa.q0_code
         self.sigma_c = []
 
+        # Drop mode: once acceptance is unreachable nothing is buffered,
+        # dropped counts the events discarded
+        self.dropping = not self.live[self.q]
+        self.dropped = 0
+
         self.output = []
 
     def step(self, a):
-        
-        # 1. Advance product DFA by ONE event
-        self.q = self.dfa.d(self.q, a)
+
+        if self.dropping:
+            self.dropped += 1
+            return []
+
+        # 1. Advance product DFA by ONE event (-1 stays undefined)
+        self.q = self.dfa.step_code(self.q, self.dfa.symbol_code[a])
+
+        # Trap reached: the buffer can never be released
+        if self.q < 0 or not self.live[self.q]:
+            self.dropping = True
+            self.dropped += len(self.sigma_c) + 1
+            self.sigma_c.clear()
+            return []
 
         # 2. Buffer the event
         self.sigma_c.append(a)
 
         # 3. If accepting → release buffer
-        if self.dfa.F(self.q):
+        if self.dfa.accepting[self.q]:
             released = self.sigma_c.copy()
             self.output.extend(released)
             self.sigma_c.clear()
@@ -45,3 +72,37 @@ class StrictMonolithicEnforcer:
 
         # Otherwise, block
         return []
+
+    def feed_many(self, events):
+
+        # Same as step() per event, in one tight loop
+        code = self.dfa.symbol_code
+        table = self.dfa.table
+        n = self.dfa.n_symbols
+        accepting = self.dfa.accepting
+        live = self.live
+
+        q = self.q
+        sigma_c = self.sigma_c
+        out = []
+
+        it = iter(events)
+        if not self.dropping:
+            for a in it:
+                q = table[q * n + code[a]]
+                if q < 0 or not live[q]:
+                    self.dropping = True
+                    self.dropped += len(sigma_c) + 1
+                    sigma_c.clear()
+                    break
+                sigma_c.append(a)
+                if accepting[q]:
+                    out.extend(sigma_c)
+                    sigma_c.clear()
+
+        if self.dropping:
+            self.dropped += sum(1 for _ in it)
+
+        self.q = q
+        self.output.extend(out)
+        return out
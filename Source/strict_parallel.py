@@ -3,18 +3,24 @@
 Strict Parallel Enforcer
 """
 
-class StrictParallelEnforcer:
+from Source.streaming import StreamingEnforcer
+
+
+class StrictParallelEnforcer(StreamingEnforcer):
     def __init__(self, dfas):
 
-        self.dfas = dfas
+        self.dfas = [dfa.compile() for dfa in dfas]
         self.k = len(dfas)
 
-        # current DFA states
-        self.q = [dfa.q0 for dfa in dfas]
+        # current DFA states (integer codes)
+        self.q = [dfa.q0_code for dfa in self.dfas]
 
         # output trace
         self.output = []
 
+    def states(self):
+        return [dfa.states[q] for dfa, q in zip(self.dfas, self.q)]
+
     def step(self, a):
 
         next_states = []
@@ -22,9 +28,9 @@ class StrictParallelEnforcer:
         # advance all DFAs in parallel
         for i, dfa in enumerate(self.dfas):
             qi = self.q[i]
-            qi_next = dfa.d(qi, a)
+            qi_next = dfa.step_code(qi, dfa.symbol_code[a])
 
-            if qi_next is None:
+            if qi_next < 0:
                 return []
 
             next_states.append(qi_next)
@@ -34,12 +40,28 @@ class StrictParallelEnforcer:
         self.output.append(a)
         return [a]
 
-    def enforce(self, input_word):
+    def feed_many(self, events):
+
+        # Same as step() per event, in one tight loop
+        rows = [(dfa.table, dfa.n_symbols, dfa.symbol_code) for dfa in self.dfas]
+        q = self.q
         out = []
-        for a in input_word:
-            out.extend(self.step(a))
+
+        for a in events:
+            nxt = []
+            for (table, n, code), qi in zip(rows, q):
+                qi = table[qi * n + code[a]]
+                if qi < 0:
+                    break
+                nxt.append(qi)
+            else:
+                q = nxt
+                out.append(a)
+
+        self.q = q
+        self.output.extend(out)
         return out
 
     def reset(self):
-        self.q = [dfa.q0 for dfa in self.dfas]
+        self.q = [dfa.q0_code for dfa in self.dfas]
         self.output = []
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Strict Parallel Enforcer (vectorised)
+
+All properties share one alphabet, so the k compiled transition tables are
+stacked into one NumPy array indexed by a global state code
+(i * Q_max + q for state q of DFA i). Advancing all k DFAs on an event is a
+single gather, whatever k is.
+
+Undefined transitions lead to one absorbing reject code R. An event that
+sends any DFA to R is dropped and every state stays put, as in
+strict_parallel.py. Single events and reject-heavy stretches take a plain
+per-event path over the same table, which is never slower than the
+loop in strict_parallel.py.
+"""
+
+import numpy as np
+
+from Source.streaming import StreamingEnforcer
+
+
+class StrictParallelEnforcer(StreamingEnforcer):
+
+    # Optimistic chunks grow from MIN_CHUNK to CHUNK events while no
+    # event is rejected and halve when one is; after a rejecting chunk up
+    # to MAX_BACKOFF further chunks are checked without an optimistic try
+    CHUNK = 1024
+    MIN_CHUNK = 16
+    MAX_BACKOFF = 64
+
+    def __init__(self, dfas):
+
+        self.dfas = [dfa.compile(complete=True) for dfa in dfas]
+        self.k = len(dfas)
+
+        self.symbols = self.dfas[0].symbols
+        self.symbol_code = self.dfas[0].symbol_code
+        for dfa in self.dfas:
+            assert dfa.symbols == self.symbols, "Alphabets must match!"
+
+        n = len(self.symbols)
+        q_max = max(len(dfa.states) for dfa in self.dfas)
+        self.q_max = q_max
+        self.R = self.k * q_max
+
+        # G[c, g] = global code reached from global state g on symbol c
+        G = np.full((n, self.R + 1), self.R, dtype=np.int64)
+        for i, dfa in enumerate(self.dfas):
+            table = np.asarray(dfa.table, dtype=np.int64)
+            table = table.reshape(len(dfa.states), n).T
+            base = i * q_max
+            G[:, base:base + len(dfa.states)] = np.where(
+                table >= 0, table + base, self.R
+            )
+        self.G = G
+        self.rows = list(G)
+        # Same rows as lists for the per-event checked path
+        self.lists = G.tolist()
+
+        self.base = [i * q_max for i in range(self.k)]
+        self.g0 = [b + dfa.q0_code for b, dfa in zip(self.base, self.dfas)]
+
+        self.reset()
+
+    @property
+    def q(self):
+        # current DFA states (integer codes)
+        return [g - b for g, b in zip(self.g, self.base)]
+
+    def states(self):
+        return [dfa.states[q] for dfa, q in zip(self.dfas, self.q)]
+
+    def encode(self, word):
+        return np.fromiter(
+            (self.symbol_code[a] for a in word), dtype=np.int64, count=len(word)
+        )
+
+    def step(self, a):
+
+        # advance all DFAs, stopping at the first one that rejects
+        row, R = self.lists[self.symbol_code[a]], self.R
+        nxt = []
+        for g in self.g:
+            g = row[g]
+            if g == R:
+                return []
+            nxt.append(g)
+
+        self.g = nxt
+
+        self.output.append(a)
+        return [a]
+
+    def run_optimistic(self, codes):
+        """
+        Advance over all of codes with one gather per event and no reject
+        check; R is absorbing, so one check at the end shows whether any
+        event was rejected. Returns whether the states were advanced.
+        """
+        rows = self.rows
+        g = np.array(self.g, dtype=np.int64)
+        for c in codes:
+            g = rows[c].take(g)
+        if (g == self.R).any():
+            return False
+        self.g = g.tolist()
+        return True
+
+    def run_checked(self, codes):
+        """
+        Advance event by event, dropping every rejected event with the
+        states kept; returns the codes that were kept.
+        """
+        lists, R = self.lists, self.R
+        g = self.g
+        kept = []
+
+        for c in codes:
+            row = lists[c]
+            nxt = []
+            for x in g:
+                x = row[x]
+                if x == R:
+                    break
+                nxt.append(x)
+            else:
+                g = nxt
+                kept.append(c)
+
+        self.g = g
+        return kept
+
+    def enforce_array(self, codes):
+        """
+        Enforce an array of symbol codes; returns the emitted codes.
+
+        Reject-free stretches run optimistically in growing chunks. A chunk
+        with a reject is rerun checked from its start states, so no event
+        is advanced twice in the optimistic pass, and while rejects keep
+        coming the optimistic try is skipped for a growing number of
+        chunks.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        emitted = []
+        pos, end = 0, len(codes)
+
+        while pos < end:
+            chunk = codes[pos:pos + self.chunk]
+            pos += len(chunk)
+            batch = chunk.tolist()
+
+            if self.skip:
+                self.skip -= 1
+            elif self.run_optimistic(batch):
+                emitted.append(chunk)
+                self.chunk = min(2 * self.chunk, self.CHUNK)
+                self.backoff = 0
+                continue
+            else:
+                self.chunk = max(self.chunk // 2, self.MIN_CHUNK)
+                self.backoff = min(2 * self.backoff or 1, self.MAX_BACKOFF)
+                self.skip = self.backoff
+
+            emitted.append(np.asarray(self.run_checked(batch), dtype=np.int64))
+
+        if not emitted:
+            return codes[:0]
+        return np.concatenate(emitted)
+
+    def feed_many(self, events):
+        events = list(events)
+        out = [self.symbols[c] for c in self.enforce_array(self.encode(events))]
+        self.output.extend(out)
+        return out
+
+    def reset(self):
+        self.g = list(self.g0)
+        self.output = []
+
+        # adaptive chunking state (see enforce_array)
+        self.chunk = self.CHUNK
+        self.backoff = 0
+        self.skip = 0
@@ -3,49 +3,79 @@
 Strict Serial Enforcer
 """
 
-class StrictSerialEnforcer:
+from Source.streaming import StreamingEnforcer
+
+
+class StrictSerialEnforcer(StreamingEnforcer):
 
 
     def __init__(self, dfas):
         assert isinstance(dfas, list) and len(dfas) > 0, "No DFAs provided"
 
-        self.dfas = dfas
+        self.dfas = [dfa.compile() for dfa in dfas]
         self.n = len(dfas)
 
-        # One buffer σci and one state qi per DFA
+        # States of each DFA from which acceptance is still reachable
+        self.live = [dfa.coreachable() for dfa in self.dfas]
+
+        self.reset()
+
+    def reset(self):
+
+        # One buffer σci and one state qi (integer code) per DFA
         self.sigma_c = {i: [] for i in range(self.n)}
-        self.q = {i: dfas[i].q0 for i in range(self.n)}
+        self.q = {i: self.dfas[i].q0_code for i in range(self.n)}
 
-        self.output = []
+        # Tentative state δ*(qi, σci) per DFA
+        self.t = dict(self.q)
 
-    def delta_star(self, dfa, q, word):
+        # Drop mode: once any stage can never accept again nothing can
+        # reach the output, so buffers are discarded and dropped counts
+        # every event lost that way
+        self.dropping = not all(
+            live[q] for live, q in zip(self.live, self.q.values())
+        )
+        self.dropped = 0
 
-        for a in word:
-            q = dfa.d(q, a)
-        return q
+        self.output = []
 
     def step(self, a):
 
+        if self.dropping:
+            self.dropped += 1
+            return []
+
         sigma = [a]          # σ ← a
         released = []
+        trapped = False
 
         for i, dfa in enumerate(self.dfas):
             sigma_next = []              # σ' ← ε
             qi = self.q[i]
+            ti = self.t[i]               # δ*(qi, σci), -1 if undefined
             sigma_ci = self.sigma_c[i]
+            code = dfa.symbol_code
 
             for e in sigma:
-                new_state = self.delta_star(dfa, qi, sigma_ci + [e])
-
-                if dfa.F(new_state):
-                    qi = new_state
-                    sigma_next.extend(sigma_ci + [e])
-                    sigma_ci.clear()
-                else:
-                    sigma_ci.append(e)
+                # Single transition from the tentative state
+                sigma_ci.append(e)
+                if ti >= 0:
+                    ti = dfa.step_code(ti, code[e])
+                if ti < 0 or not self.live[i][ti]:
+                    trapped = True
+
+                if ti >= 0 and dfa.accepting[ti]:
+                    qi = ti
+                    # Hand σci·e on to the next stage without copying
+                    if sigma_next:
+                        sigma_next.extend(sigma_ci)
+                    else:
+                        sigma_next = sigma_ci
+                    sigma_ci = []
 
             # Update local state and buffer
             self.q[i] = qi
+            self.t[i] = ti
             self.sigma_c[i] = sigma_ci
 
             sigma = sigma_next
@@ -55,7 +85,14 @@ class StrictSerialEnforcer:
 
         # Release only after the last enforcer
         if sigma:
-            released.extend(sigma)
+            released = sigma
             self.output.extend(sigma)
 
+        # A trapped stage never passes anything on again
+        if trapped:
+            self.dropping = True
+            for i in range(self.n):
+                self.dropped += len(self.sigma_c[i])
+                self.sigma_c[i].clear()
+
         return released
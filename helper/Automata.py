@@ -1,6 +1,8 @@
 # Automata.py
 
 from copy import deepcopy
+from array import array
+from collections import deque
 
 def ts(x):
     return tuple(sorted(x))
@@ -15,23 +17,219 @@ class DFA:
         self.F = F
         self.d = d
         self.e = e # empty word
+        self.compiled = False
+        self.live = None
 
         self.reset()
         
 
     def isEmpty(self):
-        
-        visited = set()
-        
-        def dfs(node):
-            visited.add(node)
-            for a in self.S:
-                q = self.d(node, a)
-                if q and q not in visited:
-                    dfs(q)
-                    
-        dfs(self.q0)
-        return all(not self.F(q) for q in visited)
+
+        q0 = self.encode_state(self.q0)
+        return not self.coreachable()[q0]
+
+
+    def compile(self, complete = False):
+        """
+        Intern states and symbols to dense integer codes.
+
+        Builds a flat transition table where table[q * n_symbols + a] is the
+        code of d(q, a) (-1 where d is undefined) and an accepting bitmap
+        indexed by state code. Only states reachable from q0 are interned
+        unless complete is set. Repeated calls extend the existing tables.
+        """
+        if not self.compiled:
+            if isinstance(self.S, (list, tuple)):
+                self.symbols = list(self.S)
+            else:
+                self.symbols = sorted(self.S)
+            self.symbol_code = {a: i for i, a in enumerate(self.symbols)}
+            self.n_symbols = len(self.symbols)
+            self.states = []
+            self.state_code = {}
+            self.table = array('l')
+            self.accepting = bytearray()
+            self.compiled = True
+
+        pending = [self.q0]
+        if complete:
+            pending.extend(self.Q)
+        self._intern(pending)
+        self.q0_code = self.state_code[self.q0]
+        return self
+
+    def _intern(self, pending):
+        # Assign codes to unseen states and fill their table rows
+        states, index = self.states, self.state_code
+        table, n = self.table, self.n_symbols
+        work = []
+
+        def add(q):
+            index[q] = len(states)
+            states.append(q)
+            self.accepting.append(1 if self.F(q) else 0)
+            table.extend([-1] * n)
+            work.append(q)
+
+        for q in pending:
+            if q not in index:
+                add(q)
+
+        while work:
+            q = work.pop()
+            base = index[q] * n
+            for j, a in enumerate(self.symbols):
+                nq = self.d(q, a)
+                if nq is None:
+                    continue
+                if nq not in index:
+                    add(nq)
+                table[base + j] = index[nq]
+
+    def encode_state(self, q):
+        if not self.compiled:
+            self.compile()
+        if q not in self.state_code:
+            self._intern([q])
+        return self.state_code[q]
+
+    def coreachable(self):
+        """
+        Label every interned state as able to reach acceptance (1) or
+        dead (0) with a single reverse-graph BFS from the accepting states,
+        O(|Q||S|) overall. The bitmap is indexed by state code and cached
+        until new states are interned.
+        """
+        if not self.compiled:
+            self.compile()
+
+        n_states = len(self.states)
+        if self.live is not None and len(self.live) == n_states:
+            return self.live
+
+        table, n = self.table, self.n_symbols
+        preds = [[] for _ in range(n_states)]
+        for q in range(n_states):
+            for nq in table[q * n:(q + 1) * n]:
+                if nq >= 0:
+                    preds[nq].append(q)
+
+        live = bytearray(self.accepting)
+        queue = deque(q for q in range(n_states) if live[q])
+        while queue:
+            q = queue.popleft()
+            for p in preds[q]:
+                if not live[p]:
+                    live[p] = 1
+                    queue.append(p)
+
+        self.live = live
+        return live
+
+    def _minimal_parts(self):
+        # Hopcroft partition refinement over the reachable compiled DFA.
+        # Undefined transitions go to an extra sink kept in its own block,
+        # so a missing transition never merges with a real dead state.
+        if not self.compiled:
+            self.compile()
+
+        n = self.n_symbols
+        N = len(self.states)
+        table = self.table
+        sink = N if any(t < 0 for t in table) else None
+        total = N if sink is None else N + 1
+
+        inv = [[[] for _ in range(total)] for _ in range(n)]
+        for q in range(total):
+            for a in range(n):
+                t = table[q * n + a] if q < N else -1
+                inv[a][sink if t < 0 else t].append(q)
+
+        accepting = {q for q in range(N) if self.accepting[q]}
+        rejecting = set(range(N)) - accepting
+        blocks = [b for b in (accepting, rejecting) if b]
+        if sink is not None:
+            blocks.append({sink})
+
+        block_of = [0] * total
+        for i, b in enumerate(blocks):
+            for q in b:
+                block_of[q] = i
+
+        work = list(range(len(blocks)))
+        in_work = set(work)
+
+        while work:
+            i = work.pop()
+            in_work.discard(i)
+            splitter = list(blocks[i])
+
+            for a in range(n):
+                hit = {}
+                for q in splitter:
+                    for p in inv[a][q]:
+                        hit.setdefault(block_of[p], set()).add(p)
+
+                for j, inside in hit.items():
+                    if len(inside) == len(blocks[j]):
+                        continue
+                    outside = blocks[j] - inside
+                    blocks[j] = inside
+                    k = len(blocks)
+                    blocks.append(outside)
+                    for q in outside:
+                        block_of[q] = k
+                    if j in in_work or len(outside) <= len(inside):
+                        work.append(k)
+                        in_work.add(k)
+                    else:
+                        work.append(j)
+                        in_work.add(j)
+
+        # One representative (lowest code) per block
+        rep = {}
+        for b in blocks:
+            if sink in b:
+                continue
+            r = self.states[min(b)]
+            for q in b:
+                rep[q] = r
+
+        Q = []
+        rows = {}
+        for q in sorted(rep):
+            r = rep[q]
+            if r in rows:
+                continue
+            Q.append(r)
+            row = {}
+            for a, sym in enumerate(self.symbols):
+                t = table[q * n + a]
+                row[sym] = None if t < 0 or t == sink else rep[t]
+            rows[r] = row
+
+        end = [r for r in Q if self.accepting[self.state_code[r]]]
+        q0 = rep[self.state_code[self.q0]]
+        return Q, q0, end, lambda q, a: rows[q][a]
+
+    def minimize(self):
+        """
+        Equivalent DFA with the fewest states (Hopcroft). States of the
+        result are representatives of their equivalence classes.
+        """
+        Q, q0, end, d = self._minimal_parts()
+        accepting = set(end)
+        M = DFA(self.S, Q, q0, lambda q: q in accepting, d, self.e)
+        if hasattr(self, "name"):
+            M.name = self.name
+        return M
+
+    def state_label(self, q):
+        return q
+
+    def step_code(self, q, a):
+        # q and a are integer codes; returns -1 when d is undefined
+        return self.table[q * self.n_symbols + a]
 
 
     def reset(self, q = None):
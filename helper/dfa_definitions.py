@@ -1,5 +1,7 @@
 # dfa_definitions.py
 
+from types import MappingProxyType
+
 from helper.product import DFA as PropertyDFA
 from helper.Automata import DFA as ExclusiveDFA    # For Exclusive properties
 
@@ -858,245 +860,134 @@ def get_all_LE_parallel_dfas():
 # EXCLUSIVE PROPERTY DFAs
 # ======================================================
 
-# A1 : decides on 'l'
-def exclusive_phi1():
 
-    def d1(q, a):
-        transitions = {
-            "q0": {"f": "q1", "l": "q0", "o": "q0", "n": "q0", "r": "q0"},
-            "q1": {"l": "q2", "f": "q1", "o": "q1", "n": "q1", "r": "q1"},
-            "q2": {"f": "q1", "l": "q2", "o": "q2", "n": "q2", "r": "q2"},
-        }
-        return transitions[q].get(a, q)
-
-    A1 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["q0", "q1", "q2"],
-        q0="q0",
-        F=lambda q: q == "q2",
-        d=d1
-    )
-    A1.name = "A1"
+EXCLUSIVE_ALPHABET = ("f", "l", "o", "n", "r")
 
-    return A1, {"l"}
+# Compact spec per property:
+#   (name, states, accepting state(s), moves, deciding events)
+# The first state is initial; every (state, event) pair not listed in
+# moves is a self-loop.
+EXCLUSIVE_SPECS = (
+    ("A1", ("q0", "q1", "q2"), "q2",
+     (("q0", "f", "q1"), ("q1", "l", "q2"), ("q2", "f", "q1")), {"l"}),
+    ("A2", ("p0", "p1", "p2"), "p2",
+     (("p0", "o", "p1"), ("p1", "n", "p2")), {"n"}),
+    ("A3", ("s0", "s1", "s2"), "s2",
+     (("s0", "r", "s1"), ("s1", "r", "s2")), {"r"}),
+    ("A4", ("t0", "t1", "t2"), "t2",
+     (("t0", "o", "t1"), ("t1", "o", "t2")), {"o"}),
+    ("A5", ("u0", "u1", "u2"), "u2",
+     (("u0", "f", "u1"), ("u1", "f", "u2")), {"f"}),
+    ("A6", ("v0", "v1", "v2"), "v2",
+     (("v0", "r", "v1"), ("v1", "r", "v2")), {"r"}),
+    ("A7", ("w0", "w1", "w2"), "w2",
+     (("w0", "o", "w1"), ("w1", "o", "w2")), {"o"}),
+    ("A8", ("x0", "x1", "x2"), "x2",
+     (("x0", "n", "x1"), ("x1", "n", "x2")), {"n"}),
+    ("A9", ("y0", "y1", "y2"), "y2",
+     (("y0", "l", "y1"), ("y1", "l", "y2")), {"l"}),
+    ("A10", ("z0", "z1", "z2"), "z2",
+     (("z0", "n", "z1"), ("z1", "n", "z2")), {"n"}),
+)
 
 
-# A2 : decides on 'n'
-def exclusive_phi2():
+def build_exclusive_table(states, moves, alphabet=EXCLUSIVE_ALPHABET):
 
-    def d2(q, a):
-        transitions = {
-            "p0": {"o": "p1", "f": "p0", "l": "p0", "n": "p0", "r": "p0"},
-            "p1": {"n": "p2", "f": "p1", "l": "p1", "o": "p1", "r": "p1"},
-            "p2": {"f": "p2", "l": "p2", "o": "p2", "n": "p2", "r": "p2"},
-        }
-        return transitions[q].get(a, q)
-
-    A2 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["p0", "p1", "p2"],
-        q0="p0",
-        F=lambda q: q == "p2",
-        d=d2
-    )
-    A2.name = "A2"
+    rows = {q: {a: q for a in alphabet} for q in states}
+    for q, a, nq in moves:
+        rows[q][a] = nq
 
-    return A2, {"n"}
+    return MappingProxyType(
+        {q: MappingProxyType(row) for q, row in rows.items()}
+    )
 
 
-# A3 : decides on 'r'
-def exclusive_phi3():
+def load_exclusive_family(specs, alphabet=EXCLUSIVE_ALPHABET):
+    """
+    Build (name, states, accepting, table, deciding) entries for a family
+    of exclusive properties from compact specs. Tables are read-only and
+    meant to be built once and shared by every DFA instance.
+    """
 
-    def d3(q, a):
-        transitions = {
-            "s0": {"r": "s1", "f": "s0", "l": "s0", "o": "s0", "n": "s0"},
-            "s1": {"r": "s2", "f": "s1", "l": "s1", "o": "s1", "n": "s1"},
-            "s2": {"f": "s2", "l": "s2", "o": "s2", "n": "s2", "r": "s2"},
-        }
-        return transitions[q].get(a, q)
-
-    A3 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["s0", "s1", "s2"],
-        q0="s0",
-        F=lambda q: q == "s2",
-        d=d3
+    return tuple(
+        (name, tuple(states), accept,
+         build_exclusive_table(states, moves, alphabet), frozenset(deciding))
+        for name, states, accept, moves, deciding in specs
     )
-    A3.name = "A3"
 
-    return A3, {"r"}
 
+EXCLUSIVE_FAMILY = load_exclusive_family(EXCLUSIVE_SPECS)
 
-# A4 : decides on 'o'
-def exclusive_phi4():
 
-    def d4(q, a):
-        transitions = {
-            "t0": {"o": "t1", "f": "t0", "l": "t0", "n": "t0", "r": "t0"},
-            "t1": {"o": "t2", "f": "t1", "l": "t1", "n": "t1", "r": "t1"},
-            "t2": {"f": "t2", "l": "t2", "o": "t2", "n": "t2", "r": "t2"},
-        }
-        return transitions[q].get(a, q)
-
-    A4 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["t0", "t1", "t2"],
-        q0="t0",
-        F=lambda q: q == "t2",
-        d=d4
+def exclusive_dfa(entry, alphabet=EXCLUSIVE_ALPHABET):
+
+    name, states, accept, table, deciding = entry
+
+    # One accepting state name, or a collection of them
+    accepting = {accept} if isinstance(accept, str) else set(accept)
+
+    A = ExclusiveDFA(
+        S=set(alphabet),
+        Q=list(states),
+        q0=states[0],
+        F=lambda q: q in accepting,
+        d=lambda q, a: table[q].get(a, q)
     )
-    A4.name = "A4"
+    A.name = name
 
-    return A4, {"o"}
+    return A, set(deciding)
 
 
-# A5 : decides on 'f'
-def exclusive_phi5():
+# A1 : decides on 'l'
+def exclusive_phi1():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[0])
 
-    def d5(q, a):
-        transitions = {
-            "u0": {"f": "u1", "l": "u0", "o": "u0", "n": "u0", "r": "u0"},
-            "u1": {"f": "u2", "l": "u1", "o": "u1", "n": "u1", "r": "u1"},
-            "u2": {"f": "u2", "l": "u2", "o": "u2", "n": "u2", "r": "u2"},
-        }
-        return transitions[q].get(a, q)
-
-    A5 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["u0", "u1", "u2"],
-        q0="u0",
-        F=lambda q: q == "u2",
-        d=d5
-    )
-    A5.name = "A5"
 
-    return A5, {"f"}
+# A2 : decides on 'n'
+def exclusive_phi2():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[1])
 
 
-# A6 : decides on 'r'
-def exclusive_phi6():
+# A3 : decides on 'r'
+def exclusive_phi3():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[2])
 
-    def d6(q, a):
-        transitions = {
-            "v0": {"r": "v1", "f": "v0", "l": "v0", "o": "v0", "n": "v0"},
-            "v1": {"r": "v2", "f": "v1", "l": "v1", "o": "v1", "n": "v1"},
-            "v2": {"r": "v2", "f": "v2", "l": "v2", "o": "v2", "n": "v2"},
-        }
-        return transitions[q].get(a, q)
-
-    A6 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["v0", "v1", "v2"],
-        q0="v0",
-        F=lambda q: q == "v2",
-        d=d6
-    )
-    A6.name = "A6"
 
-    return A6, {"r"}
+# A4 : decides on 'o'
+def exclusive_phi4():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[3])
 
 
-# A7 : decides on 'o'
-def exclusive_phi7():
+# A5 : decides on 'f'
+def exclusive_phi5():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[4])
 
-    def d7(q, a):
-        transitions = {
-            "w0": {"o": "w1", "f": "w0", "l": "w0", "n": "w0", "r": "w0"},
-            "w1": {"o": "w2", "f": "w1", "l": "w1", "n": "w1", "r": "w1"},
-            "w2": {"o": "w2", "f": "w2", "l": "w2", "n": "w2", "r": "w2"},
-        }
-        return transitions[q].get(a, q)
-
-    A7 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["w0", "w1", "w2"],
-        q0="w0",
-        F=lambda q: q == "w2",
-        d=d7
-    )
-    A7.name = "A7"
 
-    return A7, {"o"}
+# A6 : decides on 'r'
+def exclusive_phi6():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[5])
 
 
-# A8 : decides on 'n'
-def exclusive_phi8():
+# A7 : decides on 'o'
+def exclusive_phi7():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[6])
 
-    def d8(q, a):
-        transitions = {
-            "x0": {"n": "x1", "f": "x0", "l": "x0", "o": "x0", "r": "x0"},
-            "x1": {"n": "x2", "f": "x1", "l": "x1", "o": "x1", "r": "x1"},
-            "x2": {"n": "x2", "f": "x2", "l": "x2", "o": "x2", "r": "x2"},
-        }
-        return transitions[q].get(a, q)
-
-    A8 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["x0", "x1", "x2"],
-        q0="x0",
-        F=lambda q: q == "x2",
-        d=d8
-    )
-    A8.name = "A8"
 
-    return A8, {"n"}
+# A8 : decides on 'n'
+def exclusive_phi8():
+    return exclusive_dfa(EXCLUSIVE_FAMILY[7])
 
 
 # A9 : decides on 'l'
 def exclusive_phi9():
-    def d9(q, a):
-        transitions = {
-            "y0": {"l": "y1", "f": "y0", "o": "y0", "n": "y0", "r": "y0"},
-            "y1": {"l": "y2", "f": "y1", "o": "y1", "n": "y1", "r": "y1"},
-            "y2": {"l": "y2", "f": "y2", "o": "y2", "n": "y2", "r": "y2"},
-        }
-        return transitions[q].get(a, q)
-
-    A9 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["y0", "y1", "y2"],
-        q0="y0",
-        F=lambda q: q == "y2",
-        d=d9
-    )
-    A9.name = "A9"
-    return A9, {"l"}
+    return exclusive_dfa(EXCLUSIVE_FAMILY[8])
 
 
 # A10 : decides on 'n'
 def exclusive_phi10():
-
-    def d10(q, a):
-        transitions = {
-            "z0": {"n": "z1", "f": "z0", "l": "z0", "o": "z0", "r": "z0"},
-            "z1": {"n": "z2", "f": "z1", "l": "z1", "o": "z1", "r": "z1"},
-            "z2": {"n": "z2", "f": "z2", "l": "z2", "o": "z2", "r": "z2"},
-        }
-        return transitions[q].get(a, q)
-
-    A10 = ExclusiveDFA(
-        S={"f", "l", "o", "n", "r"},
-        Q=["z0", "z1", "z2"],
-        q0="z0",
-        F=lambda q: q == "z2",
-        d=d10
-    )
-    A10.name = "A10"
-    return A10, {"n"}
+    return exclusive_dfa(EXCLUSIVE_FAMILY[9])
 
 
 def get_all_dfas():
 
-    return [
-        exclusive_phi1(),
-        exclusive_phi2(),
-        exclusive_phi3(),
-        exclusive_phi4(),
-        exclusive_phi5(),
-        exclusive_phi6(),
-        exclusive_phi7(),
-        exclusive_phi8(),
-        exclusive_phi9(),
-        exclusive_phi10(),
-    ]
-
+    return [exclusive_dfa(entry) for entry in EXCLUSIVE_FAMILY]
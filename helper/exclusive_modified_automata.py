@@ -20,6 +20,7 @@ def modify_for_exclusive(orig_dfa, own_deciding, others_deciding):
 
     Q_new = list(orig_dfa.Q)
     qX_map = {}   # original state -> don't-care state
+    qX_inv = {}   # don't-care state -> original state
 
     prefix = orig_dfa.Q[0][0]
     next_index = len(orig_dfa.Q)
@@ -28,25 +29,37 @@ def modify_for_exclusive(orig_dfa, own_deciding, others_deciding):
     for q in orig_dfa.Q:
         qX = f"{prefix}{next_index}"
         qX_map[q] = qX
+        qX_inv[qX] = q
         Q_new.append(qX)
         next_index += 1
 
-    # Accepting states: original accepting OR don't-care
-    F_new = lambda q: orig_dfa.F(q) or q in qX_map.values()
     d_orig = orig_dfa.d
 
     # Modified transition function
-    def d_new(q, a):
+    def transition(q, a):
         # If already blocked (don't-care)
-        if q in qX_map.values():
-            orig = next(k for k, v in qX_map.items() if v == q)
+        orig = qX_inv.get(q)
+        if orig is not None:
             return d_orig(orig, a) if a in own_deciding else q
 
         # Normal state
         else:
             return qX_map[q] if a in others_deciding else d_orig(q, a)
 
-    return DFA(
+    # Precomputed transition table over the alphabet
+    rows = {q: {a: transition(q, a) for a in orig_dfa.S} for q in Q_new}
+
+    def d_new(q, a):
+        row = rows.get(q)
+        if row is not None and a in row:
+            return row[a]
+        return transition(q, a)
+
+    # Accepting states: original accepting OR don't-care
+    accepting = {q for q in orig_dfa.Q if orig_dfa.F(q)} | set(qX_inv)
+    F_new = lambda q: q in accepting or orig_dfa.F(q)
+
+    A = DFA(
         S=orig_dfa.S,
         Q=Q_new,
         q0=orig_dfa.q0,
@@ -54,19 +67,25 @@ def modify_for_exclusive(orig_dfa, own_deciding, others_deciding):
         d=d_new,
         e=orig_dfa.e
     )
+    A.qX_map = qX_map
+    A.qX_inv = qX_inv
+
+    return A.compile(complete=True)
 
 
 # =====================================================
 # Builder: all exclusive-modified DFAs
 # =====================================================
 
-def get_all_exclusive_modified():
+def get_all_exclusive_modified(dfas_with_deciding=None):
     """
     Returns exclusive-modified DFAs A′₁ … A′ₙ
-    constructed from the canonical DFA definitions.
+    constructed from (DFA, deciding set) pairs, by default
+    the canonical DFA definitions.
     """
 
-    dfas_with_deciding = get_all_dfas()
+    if dfas_with_deciding is None:
+        dfas_with_deciding = get_all_dfas()
     modified = []
 
     for i, (dfa, own_deciding) in enumerate(dfas_with_deciding):
@@ -31,89 +31,164 @@ class DFA(BaseDFA):
     def __init__(self, name, S, Q, q0, F, d, end, e=('.l',)):
         super().__init__(S, Q, q0, F, d, e)
         self.name = name
-        self.end = end
+        # Hashed for O(1) membership; lazy products pass a set they grow
+        self.end = end if isinstance(end, (set, frozenset)) else set(end)
         self.buffer = []
+        self.components = ()
+
+    def state_label(self, state):
+        """
+        Readable name of a state; product states are shown as their
+        component state names joined by "_".
+        """
+        if not self.components or state is None:
+            return state
+        return "_".join(
+            str(A.state_label(A.states[q]))
+            for A, q in zip(self.components, state)
+        )
+
+    def minimize(self):
+        Q, q0, end, d = self._minimal_parts()
+        accepting = set(end)
+        M = DFA(self.name, self.S, Q, q0, lambda q: q in accepting, d,
+                accepting, self.e)
+        M.components = self.components
+        return M
+
+    def run(self, current_state, event_sequence):
+        """
+        Single pass over event_sequence on the compiled table.
+
+        Returns (verdict, reached state): verdict is whether the reached
+        state is in end, and the state is None once d is undefined.
+        """
+        q = self.encode_state(current_state)
+        code = self.symbol_code
+        for e in event_sequence:
+            q = self.step_code(q, code[e])
+            if q < 0:
+                return False, None
+        state = self.states[q]
+        return state in self.end, state
 
     def is_safe(self, current_state, event_sequence):
-        state = current_state
-        for e in event_sequence:
-            state = self.d(state, e)
-            if state is None:
-                return False
-        return state in self.end
+        return self.run(current_state, event_sequence)[0]
 
     def next_state(self, current_state, event_sequence):
-        state = current_state
-        for e in event_sequence:
-            state = self.d(state, e)
-            if state is None:
-                break
-        return state
+        return self.run(current_state, event_sequence)[1]
 
 
-# ================= AND Product ================= #
+# ================= Shared construction ================= #
 
-def product_and(*args):
+def _build_product(automata, p_name, accept, lazy, max_states):
     """
-    n-ary AND-product DFA.
-    Accepting condition: ALL DFAs accept.
-
-    Usage:
-        product_and(A, B, name)
-        product_and(A1, A2, A3, ..., name)
+    Product states are tuples of component state codes, so nested products
+    and component state names containing "_" compose without parsing.
+    Transitions are memoised per (product state, symbol).
     """
 
-    assert len(args) >= 3, "Provide at least two DFAs and a product name"
-
-    *automata, p_name = args
-    assert len(automata) >= 2, "At least two DFAs are required"
-
     # Alphabet consistency
     S = automata[0].S
     for A in automata:
         assert A.S == S, "Alphabets must match!"
 
-    # Product states
-    p_states = [
-        "_".join(states)
-        for states in cartesian_product(*[A.Q for A in automata])
-    ]
+    for A in automata:
+        A.compile(complete=not lazy)
+
+    # Equal alphabets give every component the same symbol codes
+    code = automata[0].symbol_code
+    n = automata[0].n_symbols
+    tables = [A.table for A in automata]
 
     # Initial state
-    p_start = "_".join([A.q0 for A in automata])
+    p_start = tuple(A.q0_code for A in automata)
 
     # Accepting condition
     def p_F(p_state):
-        states = p_state.split("_")
-        return all(A.F(q) for A, q in zip(automata, states))
-
-    p_end = [s for s in p_states if p_F(s)]
+        return accept(A.accepting[q] for A, q in zip(automata, p_state))
 
     # Transition function
+    cache = {}
+
     def p_d(p_state, symbol):
-        states = p_state.split("_")
+        key = (p_state, symbol)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        a = code[symbol]
         next_states = []
 
-        for A, q in zip(automata, states):
-            nq = A.d(q, symbol)
-            if nq is None:
-                return None
+        for table, q in zip(tables, p_state):
+            nq = table[q * n + a]
+            if nq < 0:
+                next_states = None
+                break
             next_states.append(nq)
 
-        return "_".join(next_states)
+        nxt = tuple(next_states) if next_states is not None else None
+        cache[key] = nxt
+        return nxt
+
+    if not lazy:
+        # Product states
+        p_states = list(
+            cartesian_product(*[range(len(A.states)) for A in automata])
+        )
+
+        p_end = {s for s in p_states if p_F(s)}
+
+        assert p_start in p_states
+        assert len(p_states) > 0
+
+        P = DFA(p_name, S, p_states, p_start, p_F, p_d, p_end)
+        P.components = tuple(automata)
+        return P
+
+    # Lazy mode: the product holds only states reachable from p_start.
+    # A state is added, and its acceptance evaluated, when the transition
+    # function first reaches it; every consumer compiles the product right
+    # away, so in practice this is one up-front reachability pass
+    p_states = [p_start]
+    seen = {p_start}
+    p_end = {p_start} if p_F(p_start) else set()
+
+    def p_d_lazy(p_state, symbol):
+        nxt = p_d(p_state, symbol)
+        if nxt is not None and nxt not in seen:
+            if max_states is not None and len(p_states) >= max_states:
+                raise MemoryError(
+                    f"{p_name}: more than {max_states} product states"
+                )
+            seen.add(nxt)
+            p_states.append(nxt)
+            if p_F(nxt):
+                p_end.add(nxt)
+        return nxt
+
+    P = DFA(p_name, S, p_states, p_start, p_F, p_d_lazy, p_end)
+    P.components = tuple(automata)
+    return P
 
-    assert p_start in p_states
-    assert len(p_states) > 0
 
-    return DFA(p_name, S, p_states, p_start, p_F, p_d, p_end)
+# ================= AND Product ================= #
 
+def product_and(*args, lazy=False, max_states=None):
+    """
+    n-ary AND-product DFA.
+    Accepting condition: ALL DFAs accept.
 
-# ================= OR Product ================= #
+    Usage:
+        product_and(A, B, name)
+        product_and(A1, A2, A3, ..., name)
 
-def product_or(*args):
-    """
-    n-ary OR-product DFA.
-    Accepting condition: AT LEAST ONE DFA accepts.
+    With lazy=True the product is built over the states reachable from
+    the initial state instead of the full cartesian product. compile()
+    explores them all up front, so this is reachable-only construction,
+    not on-demand expansion while enforcing; max_states caps how many
+    may be added before MemoryError is raised.
     """
 
     assert len(args) >= 3, "Provide at least two DFAs and a product name"
@@ -121,39 +196,23 @@ def product_or(*args):
     *automata, p_name = args
     assert len(automata) >= 2, "At least two DFAs are required"
 
-    S = automata[0].S
-    for A in automata:
-        assert A.S == S, "Alphabets must match!"
+    return _build_product(automata, p_name, all, lazy, max_states)
 
-    p_states = [
-        "_".join(states)
-        for states in cartesian_product(*[A.Q for A in automata])
-    ]
-
-    p_start = "_".join([A.q0 for A in automata])
-
-    def p_F(p_state):
-        states = p_state.split("_")
-        return any(A.F(q) for A, q in zip(automata, states))
 
-    p_end = [s for s in p_states if p_F(s)]
-
-    def p_d(p_state, symbol):
-        states = p_state.split("_")
-        next_states = []
+# ================= OR Product ================= #
 
-        for A, q in zip(automata, states):
-            nq = A.d(q, symbol)
-            if nq is None:
-                return None
-            next_states.append(nq)
+def product_or(*args, lazy=False, max_states=None):
+    """
+    n-ary OR-product DFA.
+    Accepting condition: AT LEAST ONE DFA accepts.
+    """
 
-        return "_".join(next_states)
+    assert len(args) >= 3, "Provide at least two DFAs and a product name"
 
-    assert p_start in p_states
-    assert len(p_states) > 0
+    *automata, p_name = args
+    assert len(automata) >= 2, "At least two DFAs are required"
 
-    return DFA(p_name, S, p_states, p_start, p_F, p_d, p_end)
+    return _build_product(automata, p_name, any, lazy, max_states)
 
 # Backward compatibility alias
 product = product_and
@@ -0,0 +1,263 @@
+# random_dfa.py
+
+"""
+Seeded random property families for scaling experiments.
+
+A family is generated once as plain transition tables and can then be
+turned into fresh DFA objects as often as needed:
+
+  - random_tables():          n properties over a shared alphabet with
+                              controlled state count, accepting density
+                              and an optional absorbing trap state
+  - random_property_family(): PropertyDFAs (strict / least-effort use)
+  - random_exclusive_specs(): EXCLUSIVE_SPECS-style entries with a
+                              deciding set per property, for
+                              load_exclusive_family / exclusive_dfa
+
+Every non-trap state is reachable from the initial state and can reach an
+accepting state, so only the trap (if any) is dead.
+"""
+
+import numpy as np
+
+from helper.dfa_definitions import exclusive_dfa, load_exclusive_family
+from helper.product import DFA as PropertyDFA
+
+
+def random_alphabet(n_symbols):
+    # Zero-padded so the sorted order is the numbering order
+    width = len(str(n_symbols - 1))
+    return [f"e{i:0{width}d}" for i in range(n_symbols)]
+
+
+def _coreachable(rows, accepting):
+    n = len(rows)
+    preds = [[] for _ in range(n)]
+    for q, row in enumerate(rows):
+        for t in row:
+            preds[t].append(q)
+    live = [False] * n
+    stack = list(accepting)
+    for q in stack:
+        live[q] = True
+    while stack:
+        t = stack.pop()
+        for q in preds[t]:
+            if not live[q]:
+                live[q] = True
+                stack.append(q)
+    return live
+
+
+def random_table(rng, n_states, n_symbols, accepting=0.3, trap=False,
+                 trap_rate=0.05, idle=0.0, deciding=None):
+    """
+    One random DFA as (rows, accepting state indices); rows[q][c] is the
+    target of state q on symbol code c and state 0 is initial.
+
+    - accepting: fraction of non-trap states that accept (at least one,
+      never the initial state unless it is the only one)
+    - trap: make the last state an absorbing, non-accepting trap that
+      other transitions enter with probability trap_rate
+    - idle: probability that a transition is a self-loop
+    - deciding: if given, only these symbol codes may enter an accepting
+      state from elsewhere
+    """
+    work = n_states - 1 if trap else n_states
+    if work < 1:
+        raise ValueError("Need at least one non-trap state")
+    if deciding is not None and not deciding:
+        raise ValueError("Deciding set must not be empty")
+
+    k = max(1, round(accepting * work))
+    pool = np.arange(1, work) if work > 1 else np.arange(1)
+    acc = set(rng.choice(pool, size=min(k, len(pool)), replace=False).tolist())
+    is_acc = [q in acc for q in range(n_states)]
+
+    def enters(c):
+        # may symbol c lead into an accepting state from elsewhere?
+        return deciding is None or c in deciding
+
+    rows = rng.integers(0, work, size=(n_states, n_symbols))
+    rows = np.where(rng.random((n_states, n_symbols)) < idle,
+                    np.arange(n_states)[:, None], rows)
+    if trap:
+        rows = np.where(rng.random((n_states, n_symbols)) < trap_rate,
+                        n_states - 1, rows)
+        rows[n_states - 1] = n_states - 1
+    rows = rows.tolist()
+
+    for q in range(n_states):
+        for c in range(n_symbols):
+            t = rows[q][c]
+            if t != q and is_acc[t] and not enters(c):
+                rows[q][c] = q
+
+    # Spanning tree from the initial state: every work state reachable
+    tree = set()
+    visited = [0]
+    for s in rng.permutation(np.arange(1, work)).tolist():
+        for _ in range(4 * len(visited) + 8):
+            p = visited[int(rng.integers(len(visited)))]
+            free = [c for c in range(n_symbols)
+                    if (p, c) not in tree and (not is_acc[s] or enters(c))]
+            if free:
+                break
+        else:
+            raise ValueError("Alphabet too small for the requested shape")
+        c = free[int(rng.integers(len(free)))]
+        rows[p][c] = s
+        tree.add((p, c))
+        visited.append(s)
+
+    # Repair: redirect a free transition of every dead work state
+    live = _coreachable(rows, acc)
+    accepting_list = sorted(acc)
+    while not all(live[:work]):
+        progress = False
+        for u in range(work):
+            if live[u]:
+                continue
+            free = [c for c in range(n_symbols) if (u, c) not in tree]
+            into_acc = [c for c in free if enters(c)]
+            if into_acc:
+                c = into_acc[int(rng.integers(len(into_acc)))]
+                rows[u][c] = accepting_list[int(rng.integers(len(accepting_list)))]
+            elif free:
+                targets = [t for t in range(work) if live[t] and not is_acc[t]]
+                if not targets:
+                    continue
+                c = free[int(rng.integers(len(free)))]
+                rows[u][c] = targets[int(rng.integers(len(targets)))]
+            else:
+                continue
+            progress = True
+        if not progress:
+            raise ValueError("Could not make every state co-reachable")
+        live = _coreachable(rows, acc)
+
+    return rows, acc
+
+
+def random_tables(n_props, n_states, n_symbols, accepting=0.3, trap=True,
+                  trap_rate=0.05, idle=0.0, seed=0):
+    """
+    n_props independent random tables (see random_table), seeded as a whole.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        random_table(rng, n_states, n_symbols, accepting, trap, trap_rate, idle)
+        for _ in range(n_props)
+    ]
+
+
+def property_dfa(name, rows, acc, alphabet):
+
+    states = [f"q{i}" for i in range(len(rows))]
+    delta = {
+        states[q]: {a: states[t] for a, t in zip(alphabet, row)}
+        for q, row in enumerate(rows)
+    }
+    end = [states[q] for q in sorted(acc)]
+    accepting = set(end)
+
+    return PropertyDFA(
+        name,
+        list(alphabet),
+        states,
+        states[0],
+        lambda q: q in accepting,
+        lambda q, a: delta[q][a],
+        end
+    )
+
+
+def random_property_family(n_props, n_states, n_symbols, accepting=0.3,
+                           trap=True, trap_rate=0.05, idle=0.0, seed=0):
+    """
+    Loader for a random family of PropertyDFAs named phi1 ... phiN. The
+    tables are generated once; every call returns fresh DFA objects.
+    """
+    alphabet = random_alphabet(n_symbols)
+    tables = random_tables(n_props, n_states, n_symbols, accepting, trap,
+                           trap_rate, idle, seed)
+
+    def load():
+        return [
+            property_dfa(f"phi{i + 1}", rows, acc, alphabet)
+            for i, (rows, acc) in enumerate(tables)
+        ]
+
+    return load
+
+
+def deciding_sets(n_props, n_symbols, deciding_size=1, disjoint=True,
+                  rng=None):
+    """
+    Deciding symbol codes per property. Disjoint sets, as
+    modify_for_exclusive assumes, are dealt out in order from code 0 and
+    need n_props * deciding_size <= n_symbols (ValueError otherwise);
+    the remaining codes decide nothing. Otherwise each set is drawn at
+    random and sets may overlap.
+    """
+    if disjoint:
+        if n_props * deciding_size > n_symbols:
+            raise ValueError(
+                f"{n_props} disjoint deciding sets of {deciding_size} need "
+                f"at least {n_props * deciding_size} symbols, got {n_symbols}"
+            )
+        return [
+            set(range(i * deciding_size, (i + 1) * deciding_size))
+            for i in range(n_props)
+        ]
+    return [
+        set(rng.choice(n_symbols, size=deciding_size, replace=False).tolist())
+        for _ in range(n_props)
+    ]
+
+
+def random_exclusive_specs(n_props, n_states, n_symbols, deciding_size=1,
+                           disjoint=True, accepting=0.3, trap=False,
+                           trap_rate=0.05, idle=0.5, seed=0):
+    """
+    EXCLUSIVE_SPECS-style entries (name, states, accepting states, moves,
+    deciding events) over random_alphabet(n_symbols). Only a property's
+    own deciding events enter its accepting states; idle is the share of
+    self-loops, which keeps each property sparse like the hand-written
+    ones.
+    """
+    rng = np.random.default_rng(seed)
+    alphabet = random_alphabet(n_symbols)
+    decides = deciding_sets(n_props, n_symbols, deciding_size, disjoint, rng)
+
+    specs = []
+    for i, own in enumerate(decides):
+        rows, acc = random_table(rng, n_states, n_symbols, accepting, trap,
+                                 trap_rate, idle, deciding=own)
+        states = tuple(f"s{q}" for q in range(n_states))
+        moves = tuple(
+            (states[q], alphabet[c], states[t])
+            for q, row in enumerate(rows) for c, t in enumerate(row) if t != q
+        )
+        specs.append((f"A{i + 1}", states, frozenset(states[q] for q in acc),
+                       moves, {alphabet[c] for c in own}))
+    return tuple(specs), alphabet
+
+
+def random_exclusive_family(n_props, n_states, n_symbols, deciding_size=1,
+                            disjoint=True, accepting=0.3, trap=False,
+                            trap_rate=0.05, idle=0.5, seed=0):
+    """
+    Loader returning fresh (DFA, deciding set) pairs, the shape of
+    get_all_dfas(), for a random exclusive family.
+    """
+    specs, alphabet = random_exclusive_specs(
+        n_props, n_states, n_symbols, deciding_size, disjoint, accepting,
+        trap, trap_rate, idle, seed
+    )
+    family = load_exclusive_family(specs, alphabet)
+
+    def load():
+        return [exclusive_dfa(entry, alphabet) for entry in family]
+
+    return load
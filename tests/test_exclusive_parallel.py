@@ -0,0 +1,17 @@
+import numpy as np
+
+from helper.exclusive_modified_automata import get_all_exclusive_modified
+from Source.exclusive_parallel import ExclusiveParallelEnforcer
+from Source.exclusive_parallel_opt import ExclusiveParallelEnforcer as RoutedEnforcer
+
+
+def test_matches_routed_enforcer():
+    dfas = get_all_exclusive_modified()
+    symbols = dfas[0].symbols
+    rng = np.random.default_rng(0)
+    word = [symbols[c] for c in rng.integers(0, len(symbols), 3000)]
+
+    plain = ExclusiveParallelEnforcer(get_all_exclusive_modified())
+    routed = RoutedEnforcer(dfas)
+    assert [plain.step(a) for a in word] == [routed.step(a) for a in word]
+    assert plain.sigma_c == routed.sigma_c
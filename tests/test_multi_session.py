@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from helper.product import DFA
+from Source.multi_session import MultiSessionEnforcer
+
+
+def parity_dfa():
+    # Accepts words with an even number of 'a'
+    d = {("x", "a"): "y", ("x", "b"): "x", ("y", "a"): "x", ("y", "b"): "y"}
+    return DFA("even_a", ["a", "b"], ["x", "y"], "x",
+               lambda q: q == "x", lambda q, a: d[(q, a)], ["x"])
+
+
+def reference(pairs):
+    # Sequential per-session enforcement of parity_dfa
+    parity, pending, released = {}, {}, []
+    for sid, a in pairs:
+        parity[sid] = parity.get(sid, 0) ^ (a == "a")
+        pending.setdefault(sid, []).append(a)
+        if not parity[sid]:
+            released.append((sid, pending.pop(sid)))
+    return released, pending
+
+
+def test_batch_matches_sequential_enforcement():
+    rng = np.random.default_rng(0)
+    enf = MultiSessionEnforcer(parity_dfa(), capacity=8)
+    sids = [enf.open_session() for _ in range(100)]
+
+    # One long session next to many short ones, so both the vectorised
+    # ranks and the per-pair tail are exercised
+    sessions = [sids[0]] * 500 + [s for s in sids for _ in range(40)]
+    sessions = [sessions[i] for i in rng.permutation(len(sessions))]
+    pairs = [(sid, "ab"[int(c)]) for sid, c in
+             zip(sessions, rng.integers(0, 2, len(sessions)))]
+
+    released, pending = reference(pairs)
+    assert enf.feed(pairs) == released
+    assert {sid: enf.pending(sid) for sid in pending} == pending
+
+
+def test_close_session_twice_raises():
+    enf = MultiSessionEnforcer(parity_dfa(), capacity=4)
+    sid = enf.open_session()
+    enf.close_session(sid)
+    with pytest.raises(KeyError):
+        enf.close_session(sid)
+    assert len({enf.open_session() for _ in range(8)}) == 8
+
+
+def test_unknown_sessions_raise():
+    enf = MultiSessionEnforcer(parity_dfa(), capacity=4)
+    sid = enf.open_session()
+    for bad in (-1, 4, 100, sid + 1):
+        with pytest.raises(KeyError):
+            enf.feed([(sid, "a"), (bad, "a")])
+        with pytest.raises(KeyError):
+            enf.close_session(bad)
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        MultiSessionEnforcer(parity_dfa(), capacity=0)
+    enf = MultiSessionEnforcer(parity_dfa(), capacity=1)
+    assert len({enf.open_session() for _ in range(5)}) == 5
+
+
+def prefix_dfa():
+    # Accepts words starting "ab"; any other start is dead for good
+    d = {("s", "a"): "a", ("a", "b"): "ok", ("ok", "a"): "ok", ("ok", "b"): "ok",
+         ("s", "b"): "trap", ("a", "a"): "trap",
+         ("trap", "a"): "trap", ("trap", "b"): "trap"}
+    return DFA("ab_prefix", ["a", "b"], ["s", "a", "ok", "trap"], "s",
+               lambda q: q == "ok", lambda q, a: d[(q, a)], ["ok"])
+
+
+def test_dead_sessions_drop_instead_of_buffering():
+    enf = MultiSessionEnforcer(prefix_dfa(), capacity=64)
+    good, bad, late = enf.open_session(), enf.open_session(), enf.open_session()
+
+    # late buffers an 'a' first, then goes dead on the second 'a'
+    pairs = [(good, "a"), (bad, "b"), (late, "a"), (good, "b")]
+    pairs += [(sid, "ab"[i % 2]) for i in range(300) for sid in (bad, late)]
+    pairs += [(late, "a")] * 50        # long tail on the per-pair path
+
+    # Enough sessions for the vectorised ranks
+    crowd = [enf.open_session() for _ in range(40)]
+    pairs += [(sid, "b") for _ in range(3) for sid in crowd]
+
+    assert enf.feed(pairs) == [(good, ["a", "b"])]
+    assert all(enf.dropped[sid] == 3 for sid in crowd)
+    assert enf.pending(bad) == enf.pending(late) == []
+    assert enf.dropped[bad] == 301
+    assert enf.dropped[late] == 351
+
+    # A reused id starts over
+    enf.close_session(late)
+    assert enf.open_session() == late and enf.dropped[late] == 0
+
+
+def test_minimised_dead_product_drops_everything():
+    from helper.dfa_definitions import get_all_Strict_mono_dfas
+    from Source.strict_mono import StrictMonolithicEnforcer
+
+    enf = MultiSessionEnforcer(StrictMonolithicEnforcer(get_all_Strict_mono_dfas()).dfa)
+    sid = enf.open_session()
+    symbols = enf.symbols
+    assert enf.feed([(sid, symbols[i % len(symbols)]) for i in range(100)]) == []
+    assert enf.pending(sid) == [] and enf.dropped[sid] == 100
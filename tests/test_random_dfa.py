@@ -0,0 +1,18 @@
+import pytest
+
+from helper.random_dfa import deciding_sets, random_exclusive_specs
+
+
+def test_disjoint_deciding_sets_need_enough_symbols():
+    sets = deciding_sets(4, 10, deciding_size=2)
+    assert sum(len(s) for s in sets) == len(set().union(*sets)) == 8
+    with pytest.raises(ValueError):
+        deciding_sets(6, 10, deciding_size=2)
+
+
+def test_exclusive_specs_keep_deciding_sets_disjoint():
+    specs, alphabet = random_exclusive_specs(12, 20, 16, seed=1)
+    deciding = [spec[4] for spec in specs]
+    assert len(set().union(*deciding)) == 12
+    with pytest.raises(ValueError):
+        random_exclusive_specs(12, 20, 8)
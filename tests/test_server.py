@@ -0,0 +1,42 @@
+import asyncio
+
+from Source.server import EnforcementServer, load_enforcers
+
+
+def test_max_sessions_refuses_extra_connections():
+
+    async def run():
+        server = EnforcementServer(load_enforcers(["strict_parallel"], None),
+                                   max_sessions=2)
+        srv = await server.serve_tcp("127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+
+        held = [await asyncio.open_connection("127.0.0.1", port)
+                for _ in range(2)]
+        for _, writer in held:
+            writer.write(b"strict_parallel\n")
+            await writer.drain()
+        while server.sessions < 2:
+            await asyncio.sleep(0.01)
+
+        reader, _ = await asyncio.open_connection("127.0.0.1", port)
+        refused = await reader.read()
+
+        for reader, writer in held:
+            writer.write_eof()
+            await reader.read()
+        while server.sessions:
+            await asyncio.sleep(0.01)
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"strict_parallel\nr\n")
+        writer.write_eof()
+        served = await reader.read()
+
+        srv.close()
+        await srv.wait_closed()
+        return refused, served
+
+    refused, served = asyncio.run(asyncio.wait_for(run(), 10))
+    assert refused == b"!error Too many sessions\n"
+    assert served == b"r\n"
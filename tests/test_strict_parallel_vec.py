@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from helper.product import DFA
+from Source.strict_parallel import StrictParallelEnforcer as LoopEnforcer
+from Source.strict_parallel_vec import StrictParallelEnforcer as VecEnforcer
+
+
+def partial_dfa(seed, n_states=10, n_symbols=5, undefined=0.1):
+    # Random DFA with a share of undefined transitions
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, n_states, size=(n_states, n_symbols))
+    hole = rng.random((n_states, n_symbols)) < undefined
+    S = [f"e{c}" for c in range(n_symbols)]
+    Q = [f"q{i}" for i in range(n_states)]
+    d = {
+        (Q[q], S[c]): None if hole[q, c] else Q[rows[q, c]]
+        for q in range(n_states) for c in range(n_symbols)
+    }
+    return DFA("phi", S, Q, Q[0], lambda q: True, lambda q, a: d[(q, a)], Q)
+
+
+def word(n, seed=1):
+    return [f"e{c}" for c in np.random.default_rng(seed).integers(0, 5, n)]
+
+
+@pytest.mark.parametrize("undefined", [0.0, 0.02, 0.1, 0.4])
+@pytest.mark.parametrize("k", [1, 8, 30])
+def test_matches_loop_enforcer(k, undefined):
+    events = word(5000)
+    loop = LoopEnforcer([partial_dfa(s, undefined=undefined) for s in range(k)])
+    vec = VecEnforcer([partial_dfa(s, undefined=undefined) for s in range(k)])
+
+    assert vec.feed_many(events) == loop.feed_many(events)
+    assert vec.states() == loop.states()
+
+    vec.reset()
+    assert [b for a in events for b in vec.step(a)] == loop.output
+
+
+def test_reject_heavy_stream_is_linear(monkeypatch):
+    # With frequent rejects the optimistic tries back off, so they cover
+    # only a small share of the input instead of a chunk per reject
+    events = word(20000)
+    vec = VecEnforcer([partial_dfa(s, undefined=0.1) for s in range(8)])
+
+    optimistic = []
+    run = vec.run_optimistic
+    monkeypatch.setattr(vec, "run_optimistic",
+                        lambda codes: optimistic.append(len(codes)) or run(codes))
+
+    loop = LoopEnforcer([partial_dfa(s, undefined=0.1) for s in range(8)])
+    assert vec.feed_many(events) == loop.feed_many(events)
+    assert sum(optimistic) <= len(events) // 4
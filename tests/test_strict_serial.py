@@ -0,0 +1,27 @@
+import numpy as np
+
+from helper.random_dfa import random_alphabet, random_property_family
+from Source.strict_serial import StrictSerialEnforcer
+
+
+def test_dropped_counts_survive_output_truncation():
+    load = random_property_family(3, 12, 4, trap_rate=0.02, seed=3)
+    alphabet = random_alphabet(4)
+    rng = np.random.default_rng(0)
+
+    for _ in range(20):
+        word = [alphabet[c] for c in rng.integers(0, 4, 400)]
+
+        kept = StrictSerialEnforcer(load())
+        released = kept.feed_many(word)
+
+        # A consumer that clears the output after every event, as the
+        # enforcement server does after every batch
+        cleared = StrictSerialEnforcer(load())
+        for a in word:
+            cleared.step(a)
+            cleared.output.clear()
+
+        assert kept.dropping
+        assert kept.dropped == len(word) - len(released)
+        assert cleared.dropped == kept.dropped
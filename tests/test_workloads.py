@@ -0,0 +1,16 @@
+import pytest
+
+from Performance.bench import registry
+from Performance.bench.harness import traces
+from Performance.bench.memory import buffer_lengths
+
+
+@pytest.mark.parametrize("name", ["Strict_Monolithic", "LE_Monolithic"])
+@pytest.mark.parametrize("family", ["default", "prop"])
+def test_adversarial_trace_keeps_enforcer_pending(name, family):
+    n = 2000
+    word = traces(name, family, 2, seed=0, workload="adversarial")(n, 0)
+
+    enf = registry.build(name, registry.load_dfas(name, family, 2))
+    assert enf.feed_many(word) == []
+    assert buffer_lengths(enf)[2] == n